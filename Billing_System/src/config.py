@@ -1,8 +1,10 @@
 """Config loader & validator for the billing system."""
 
+import copy
 import json
 import sys
 import warnings
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -23,14 +25,28 @@ CONFIG_PATH = BASE_DIR / "config" / "config.json"
 
 
 def load_config(path: Path = CONFIG_PATH) -> dict:
-    """Load and validate config.json."""
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
+    """Load and validate config.json.
 
+    The parsed config is cached per (path, mtime, size), so an edited file
+    is re-read automatically.  Callers get their own deep copy and may
+    mutate it freely.
+    """
+    try:
+        st = Path(path).stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+
+    config = _load_config_cached(str(path), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> dict:
     with open(path, "r", encoding="utf-8") as f:
         config = json.load(f)
 
     _validate(config)
+    index_firms(config)
     return config
 
 
@@ -82,15 +98,45 @@ def _validate(config: dict) -> None:
             raise ValueError(f"Path '{label}' does not exist: {p}")
 
 
+def index_firms(config: dict) -> None:
+    """(Re)build the derived firm lookups after ``config["firms"]`` changes.
+
+    Keys starting with "_" are derived and must not be written back to
+    config.json.
+    """
+    by_name: dict[str, dict] = {}
+    for firm in config["firms"]:
+        by_name.setdefault(firm["name"].lower(), firm)  # first match wins
+    config["_firm_names"] = frozenset(f["name"] for f in config["firms"])
+    config["_firms_by_name"] = by_name
+
+
+def firm_name_set(config: dict) -> frozenset[str]:
+    """Return configured firm names for O(1) membership checks.
+
+    load_config() precomputes this as config["_firm_names"] (see index_firms).
+    """
+    names = config.get("_firm_names")
+    if names is None:
+        names = frozenset(f["name"] for f in config["firms"])
+    return names
+
+
 def get_firm(name: str, config: dict | None = None) -> dict:
     """Look up a firm by name (case-insensitive)."""
     if config is None:
         config = load_config()
 
     target = name.lower()
-    for firm in config["firms"]:
-        if firm["name"].lower() == target:
+    by_name = config.get("_firms_by_name")
+    if by_name is not None:
+        firm = by_name.get(target)
+        if firm is not None:
             return firm
+    else:
+        for firm in config["firms"]:
+            if firm["name"].lower() == target:
+                return firm
 
     available = [f["name"] for f in config["firms"]]
     raise KeyError(f"Firm '{name}' not found. Available: {available}")
@@ -14,14 +14,16 @@ Unique key within a firm file:  (index_number, appearance_date)
 
 import calendar
 import contextlib
+import io
+import re
+import threading
 import uuid
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-
 from src.config import CONFIG_PATH, get_data_root as _cfg_get_data_root, load_config
 
 # ── Schema ────────────────────────────────────────────────────────────
@@ -129,7 +131,9 @@ def load_cases(firm_name: str) -> list[dict]:
     if not path.exists():
         raise FileNotFoundError(f"Dataset not found: {path}")
 
-    wb = load_workbook(path)
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
     if not _is_v2_format(wb):
         wb.close()
         raise ValueError(f"Dataset for '{firm_name}' is v1 format — migrate first.")
@@ -151,7 +155,9 @@ def load_appearances(firm_name: str) -> list[dict]:
     if not path.exists():
         raise FileNotFoundError(f"Dataset not found: {path}")
 
-    wb = load_workbook(path)
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
     if not _is_v2_format(wb):
         wb.close()
         raise ValueError(f"Dataset for '{firm_name}' is v1 format — migrate first.")
@@ -174,8 +180,10 @@ def get_case_by_index(firm_name: str, index_number: str, wb=None) -> dict | None
     """
     close_wb = False
     if wb is None:
+        from openpyxl import load_workbook
+
         path = dataset_path(firm_name)
-        wb = load_workbook(path)
+        wb = load_workbook(path, read_only=True, data_only=True)
         close_wb = True
 
     try:
@@ -294,97 +302,152 @@ def _split_row_data(row_data: dict, firm_name: str) -> tuple[dict, dict]:
 
 # ── Create ────────────────────────────────────────────────────────────
 
-HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
-
-
 def _write_sheet_headers(ws, columns: list[str]) -> None:
     """Write styled header row to a worksheet."""
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=11)
+    header_align = Alignment(horizontal="center")
     for col_idx, name in enumerate(columns, start=1):
         cell = ws.cell(row=1, column=col_idx, value=name)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = Alignment(horizontal="center")
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
     for col_idx, name in enumerate(columns, start=1):
         ws.column_dimensions[get_column_letter(col_idx)].width = max(len(name) + 4, 14)
     ws.freeze_panes = "A2"
 
 
-def create_workbook(firm_name: str, overwrite: bool = False) -> Path:
-    """Create a new master dataset with v2 two-sheet format (cases + appearances)."""
-    from src.file_lock import FirmFileLock
+@lru_cache(maxsize=1)
+def _blank_workbook_bytes() -> bytes:
+    """Serialized empty v2 workbook — identical for every firm, so built once."""
+    from openpyxl import Workbook
 
-    path = dataset_path(firm_name)
+    wb = Workbook()
 
+    # Sheet 1: cases
+    ws_cases = wb.active
+    ws_cases.title = "cases"
+    _write_sheet_headers(ws_cases, CASE_COLUMNS)
+
+    # Sheet 2: appearances
+    ws_app = wb.create_sheet("appearances")
+    _write_sheet_headers(ws_app, APPEARANCE_COLUMNS)
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def _check_can_create(path: Path, overwrite: bool) -> None:
     if path.exists() and not overwrite:
         raise FileExistsError(
             f"Dataset already exists: {path}\n"
             "Use --force to overwrite (this will erase all data)."
         )
 
-    with FirmFileLock(firm_name):
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        wb = Workbook()
 
-        # Sheet 1: cases
-        ws_cases = wb.active
-        ws_cases.title = "cases"
-        _write_sheet_headers(ws_cases, CASE_COLUMNS)
+def create_workbook(firm_name: str, overwrite: bool = False) -> Path:
+    """Create a new master dataset with v2 two-sheet format (cases + appearances)."""
+    from src.file_lock import FirmFileLock
 
-        # Sheet 2: appearances
-        ws_app = wb.create_sheet("appearances")
-        _write_sheet_headers(ws_app, APPEARANCE_COLUMNS)
+    path = dataset_path(firm_name)
+    _check_can_create(path, overwrite)
 
-        wb.save(path)
+    with FirmFileLock(firm_name):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(_blank_workbook_bytes())
+        invalidate_dataset_cache(path)
     return path
 
 
 def create_all_workbooks(config: dict | None = None, overwrite: bool = False) -> list[Path]:
-    """Create master_cases.xlsx for every firm in config. Returns list of created paths."""
-    created: list[Path] = []
-    for name in all_firm_names(config):
-        path = create_workbook(name, overwrite=overwrite)
-        created.append(path)
-    return created
+    """Create master_cases.xlsx for every firm in config. Returns list of created paths.
+
+    All paths are checked up front, so an existing dataset aborts before
+    any file is written.  Files are then written in parallel.
+    """
+    names = all_firm_names(config)
+    for name in names:
+        _check_can_create(dataset_path(name), overwrite)
+
+    if len(names) <= 1:
+        return [create_workbook(name, overwrite=overwrite) for name in names]
+
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+        return list(pool.map(lambda n: create_workbook(n, overwrite=overwrite), names))
 
 
 # ── Load ──────────────────────────────────────────────────────────────
 
+# Parsed rows per dataset path, keyed on (mtime_ns, size) so edits made
+# elsewhere (Excel, another PC) are picked up.  Our own writers also call
+# invalidate_dataset_cache() after saving.
+_rows_cache: dict[Path, tuple[tuple[int, int], list[dict]]] = {}
+_index_cache: dict[Path, tuple[tuple[int, int], dict[tuple[str, str], dict]]] = {}
+# (cached rows list, [(appearance date, row), ...] sorted by date)
+_dated_cache: dict[Path, tuple[list[dict], list[tuple[date, dict]]]] = {}
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def invalidate_dataset_cache(path: Path | None = None) -> None:
+    """Drop cached rows for *path* (or for every dataset when None)."""
+    if path is None:
+        _rows_cache.clear()
+        _index_cache.clear()
+        _dated_cache.clear()
+    else:
+        _rows_cache.pop(path, None)
+        _index_cache.pop(path, None)
+        _dated_cache.pop(path, None)
 
-def _load_v1(wb) -> list[dict]:
-    """Load rows from a v1 single-sheet workbook."""
-    ws = wb["cases"]
-    headers = [cell.value for cell in ws[1]]
-    rows = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        if all(v is None for v in row):
-            continue
-        rows.append(dict(zip(headers, row)))
-    return rows
 
+# A sheet read into memory: (headers, [(excel_row_num, values), ...]) with
+# blank rows dropped.  Read-only worksheets re-parse their XML on every
+# iter_rows() call, so each sheet is streamed once and shared by the
+# validator and the loader.
+Sheet = tuple[list, list[tuple[int, tuple]]]
 
-def _load_v2_merged(wb) -> list[dict]:
-    """Load and join cases + appearances into backward-compatible merged dicts."""
+
+def _read_sheet(ws) -> Sheet:
+    """Stream a worksheet once into headers + non-blank numbered rows."""
+    it = ws.iter_rows(values_only=True)
+    headers = list(next(it, ()))
+    rows = [
+        (row_num, row)
+        for row_num, row in enumerate(it, start=2)
+        if not all(v is None for v in row)
+    ]
+    return headers, rows
+
+
+def _load_v1(cases: Sheet) -> list[dict]:
+    """Build row dicts from a v1 single-sheet workbook's 'cases' sheet."""
+    headers, rows = cases
+    return [dict(zip(headers, row)) for _, row in rows]
+
+
+def _load_v2_merged(cases: Sheet, appearances: Sheet) -> list[dict]:
+    """Join cases + appearances into backward-compatible merged dicts."""
     # Build case lookup by case_id
-    ws_cases = wb["cases"]
-    case_headers = [cell.value for cell in ws_cases[1]]
+    case_headers, case_rows = cases
     cases_by_id: dict[str, dict] = {}
-    for row in ws_cases.iter_rows(min_row=2, values_only=True):
-        if all(v is None for v in row):
-            continue
+    for _, row in case_rows:
         case_dict = dict(zip(case_headers, row))
         cid = case_dict.get("case_id")
         if cid:
             cases_by_id[str(cid)] = case_dict
 
-    # Load appearances and merge
-    ws_app = wb["appearances"]
-    app_headers = [cell.value for cell in ws_app[1]]
+    # Merge appearances
+    app_headers, app_rows = appearances
     merged_rows: list[dict] = []
-    for row in ws_app.iter_rows(min_row=2, values_only=True):
-        if all(v is None for v in row):
-            continue
+    for _, row in app_rows:
         app_dict = dict(zip(app_headers, row))
         case_id = str(app_dict.get("case_id", ""))
         case_dict = cases_by_id.get(case_id, {})
@@ -399,6 +462,11 @@ def load_dataset(firm_name: str) -> list[dict]:
     Automatically detects v1 (single-sheet) vs v2 (two-sheet) format.
     Always returns backward-compatible dicts with all COLUMNS keys.
     """
+    return [dict(r) for r in _cached_rows(firm_name)[1]]
+
+
+def _cached_rows(firm_name: str) -> tuple[tuple[int, int], list[dict]]:
+    """Return (file stamp, cached rows) for a firm; the rows are shared, not copied."""
     path = dataset_path(firm_name)
 
     if not path.exists():
@@ -407,25 +475,58 @@ def load_dataset(firm_name: str) -> list[dict]:
             f"Run 'python -m src.main init-dataset' first."
         )
 
-    wb = load_workbook(path)
+    stamp = _file_stamp(path)
+    cached = _rows_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
 
     if _is_v2_format(wb):
-        rows = _load_v2_merged(wb)
+        rows = _load_v2_merged(_read_sheet(wb["cases"]), _read_sheet(wb["appearances"]))
     else:
-        rows = _load_v1(wb)
+        rows = _load_v1(_read_sheet(wb["cases"]))
 
     wb.close()
-    return rows
+    _rows_cache[path] = (stamp, rows)
+    return stamp, rows
+
+
+def row_key(index_number, appearance_date) -> tuple[str, str]:
+    """Return the normalised load_index() key for a case appearance."""
+    return str(index_number).strip().lower(), str(appearance_date)
+
+
+def load_index(firm_name: str) -> dict[tuple[str, str], dict]:
+    """Return ``{(index_number, appearance_date): row}`` for a firm's dataset.
+
+    Keys are normalised like find_row_by_key() (stripped, lower-cased index;
+    date as a string).  The index is cached per file stamp and its rows are
+    shared with the cache, so copy a row before mutating it.
+    """
+    path = dataset_path(firm_name)
+    stamp, rows = _cached_rows(firm_name)
+    cached = _index_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    index: dict[tuple[str, str], dict] = {}
+    for row in rows:
+        key = row_key(row.get("index_number", ""), row.get("appearance_date", ""))
+        index.setdefault(key, row)  # first match wins, as in the linear scan
+    _index_cache[path] = (stamp, index)
+    return index
 
 
 # ── Validate ──────────────────────────────────────────────────────────
 
 
-def _validate_v1(wb, path) -> list[str]:
-    """Validate a v1 single-sheet workbook."""
+def _validate_v1(cases: Sheet) -> list[str]:
+    """Validate a v1 single-sheet workbook's 'cases' sheet."""
     errors: list[str] = []
-    ws = wb["cases"]
-    headers = [cell.value for cell in ws[1]]
+    headers, rows = cases
 
     missing_cols = [c for c in COLUMNS if c not in headers]
     if missing_cols:
@@ -433,10 +534,8 @@ def _validate_v1(wb, path) -> list[str]:
         return errors
 
     seen_keys: set[tuple] = set()
-    for row_num, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+    for row_num, row in rows:
         row_dict = dict(zip(headers, row))
-        if all(v is None for v in row):
-            continue
         errors.extend(_validate_row_common(row_dict, row_num))
         key = (
             str(row_dict.get("index_number", "")).strip().lower(),
@@ -449,13 +548,12 @@ def _validate_v1(wb, path) -> list[str]:
     return errors
 
 
-def _validate_v2(wb, path) -> list[str]:
+def _validate_v2(cases: Sheet, appearances: Sheet) -> list[str]:
     """Validate a v2 two-sheet workbook (cases + appearances + referential integrity)."""
     errors: list[str] = []
 
     # Validate cases sheet
-    ws_cases = wb["cases"]
-    case_headers = [cell.value for cell in ws_cases[1]]
+    case_headers, case_rows = cases
     missing_case_cols = [c for c in CASE_COLUMNS if c not in case_headers]
     if missing_case_cols:
         errors.append(f"Cases sheet: missing columns {missing_case_cols}")
@@ -463,9 +561,7 @@ def _validate_v2(wb, path) -> list[str]:
 
     case_ids: set[str] = set()
     seen_index_numbers: set[str] = set()
-    for row_num, row in enumerate(ws_cases.iter_rows(min_row=2, values_only=True), start=2):
-        if all(v is None for v in row):
-            continue
+    for row_num, row in case_rows:
         row_dict = dict(zip(case_headers, row))
 
         cid = row_dict.get("case_id")
@@ -494,8 +590,7 @@ def _validate_v2(wb, path) -> list[str]:
                 )
 
     # Validate appearances sheet
-    ws_app = wb["appearances"]
-    app_headers = [cell.value for cell in ws_app[1]]
+    app_headers, app_rows = appearances
     missing_app_cols = [c for c in APPEARANCE_COLUMNS if c not in app_headers]
     if missing_app_cols:
         errors.append(f"Appearances sheet: missing columns {missing_app_cols}")
@@ -503,9 +598,7 @@ def _validate_v2(wb, path) -> list[str]:
 
     seen_app_ids: set[str] = set()
     seen_keys: set[tuple] = set()
-    for row_num, row in enumerate(ws_app.iter_rows(min_row=2, values_only=True), start=2):
-        if all(v is None for v in row):
-            continue
+    for row_num, row in app_rows:
         row_dict = dict(zip(app_headers, row))
 
         # appearance_id uniqueness
@@ -536,9 +629,7 @@ def _validate_v2(wb, path) -> list[str]:
             elif isinstance(ad, date):
                 pass
             elif isinstance(ad, str):
-                try:
-                    datetime.strptime(ad, "%Y-%m-%d")
-                except ValueError:
+                if _parse_ymd(ad) is None:
                     errors.append(
                         f"Appearances row {row_num}: appearance_date '{ad}' is not YYYY-MM-DD"
                     )
@@ -586,9 +677,7 @@ def _validate_row_common(row_dict: dict, row_num: int) -> list[str]:
         elif isinstance(ad, date):
             pass
         elif isinstance(ad, str):
-            try:
-                datetime.strptime(ad, "%Y-%m-%d")
-            except ValueError:
+            if _parse_ymd(ad) is None:
                 errors.append(
                     f"Row {row_num}: appearance_date '{ad}' is not YYYY-MM-DD"
                 )
@@ -619,28 +708,42 @@ def _validate_row_common(row_dict: dict, row_num: int) -> list[str]:
     return errors
 
 
-def validate_dataset(firm_name: str) -> list[str]:
-    """Validate a firm's dataset file. Returns list of error messages (empty = OK).
+def validate_dataset(firm_name: str) -> tuple[list[str], int]:
+    """Validate a firm's dataset file. Returns (errors, row_count); errors empty = OK.
 
-    Automatically detects v1 vs v2 format.
+    Automatically detects v1 vs v2 format.  The row count (appearances in
+    v2, case rows in v1) comes from the validation pass, so rows are not
+    merged just to be counted.
     """
     path = dataset_path(firm_name)
-    errors: list[str] = []
-
     if not path.exists():
-        return [f"Dataset file not found: {path}"]
+        return [f"Dataset file not found: {path}"], 0
 
-    wb = load_workbook(path)
+    errors, cases, appearances = _read_and_validate(path)
+    data_rows = appearances if appearances is not None else cases
+    return errors, len(data_rows[1]) if data_rows is not None else 0
 
-    if _is_v2_format(wb):
-        errors = _validate_v2(wb, path)
-    elif "cases" in wb.sheetnames:
-        errors = _validate_v1(wb, path)
-    else:
-        errors = ["Missing required sheet 'cases'"]
 
-    wb.close()
-    return errors
+def _read_and_validate(path: Path) -> tuple[list[str], Sheet | None, Sheet | None]:
+    """Open a dataset once and validate it. Returns (errors, cases, appearances).
+
+    *appearances* is None for v1 workbooks; both sheets are None when the
+    'cases' sheet is missing.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        # Each sheet is streamed once and shared by validation and loading
+        if _is_v2_format(wb):
+            cases, appearances = _read_sheet(wb["cases"]), _read_sheet(wb["appearances"])
+            return _validate_v2(cases, appearances), cases, appearances
+        if "cases" in wb.sheetnames:
+            cases = _read_sheet(wb["cases"])
+            return _validate_v1(cases), cases, None
+        return ["Missing required sheet 'cases'"], None, None
+    finally:
+        wb.close()
 
 
 # ── Lookup ────────────────────────────────────────────────────────────
@@ -652,18 +755,21 @@ def find_row_by_key(
     appearance_date: str | date,
     rows: list[dict] | None = None,
 ) -> dict | None:
-    """Find a row by its unique key within a firm's dataset. Returns the dict or None."""
-    if rows is None:
-        rows = load_dataset(firm_name)
+    """Find a row by its unique key within a firm's dataset. Returns the dict or None.
+
+    Without *rows* the lookup goes through the cached load_index().
+    """
+    key = row_key(index_number, appearance_date)
 
-    target_idx = index_number.strip().lower()
-    target_date = str(appearance_date)
+    if rows is None:
+        row = load_index(firm_name).get(key)
+        queued = _queued_update(firm_name, key)
+        if row is None or queued is None:
+            return dict(row) if row is not None else None
+        return {**row, **queued}
 
     for row in rows:
-        if (
-            str(row.get("index_number", "")).strip().lower() == target_idx
-            and str(row.get("appearance_date", "")) == target_date
-        ):
+        if row_key(row.get("index_number", ""), row.get("appearance_date", "")) == key:
             return row
 
     return None
@@ -672,122 +778,142 @@ def find_row_by_key(
 # ── Upsert ────────────────────────────────────────────────────────────
 
 
-def _match_key(ws, headers: list[str], index_number: str, appearance_date: str) -> int | None:
-    """Return the Excel row number of a matching key, or None."""
+def _upsert_v1(wb, rows: list[dict]) -> list[str]:
+    """Upsert rows into a v1 single-sheet workbook (in memory; caller saves)."""
+    ws = wb["cases"]
+    headers = [cell.value for cell in ws[1]]
+    col_of = {name: i for i, name in enumerate(headers, start=1)}
     idx_col = headers.index("index_number")
     date_col = headers.index("appearance_date")
-    target_idx = index_number.strip().lower()
-    target_date = str(appearance_date)
 
+    # (index_number, appearance_date) -> Excel row number (first match wins)
+    row_by_key: dict[tuple[str, str], int] = {}
     for row_num, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
-        row_idx = str(row[idx_col] or "").strip().lower()
-        row_date = str(row[date_col] or "")
-        if row_idx == target_idx and row_date == target_date:
-            return row_num
-    return None
+        key = (str(row[idx_col] or "").strip().lower(), str(row[date_col] or ""))
+        row_by_key.setdefault(key, row_num)
 
+    actions: list[str] = []
+    for row_data in rows:
+        key = (
+            str(row_data.get("index_number", "")).strip().lower(),
+            str(row_data.get("appearance_date", "")),
+        )
+        existing_row = row_by_key.get(key)
+        if existing_row is not None:
+            for col_name, value in row_data.items():
+                if col_name in col_of:
+                    ws.cell(row=existing_row, column=col_of[col_name], value=value)
+            actions.append("updated")
+        else:
+            ws.append([row_data.get(col) for col in headers])
+            row_by_key[key] = ws.max_row
+            actions.append("inserted")
+    return actions
 
-def _match_appearance(ws_app, app_headers: list[str], case_id: str, appearance_date: str) -> int | None:
-    """Return the Excel row number of a matching appearance, or None."""
-    cid_col = app_headers.index("case_id")
-    date_col = app_headers.index("appearance_date")
-    target_date = str(appearance_date)
 
-    for row_num, row in enumerate(ws_app.iter_rows(min_row=2, values_only=True), start=2):
-        row_cid = str(row[cid_col] or "").strip()
-        row_date = str(row[date_col] or "")
-        if row_cid == case_id and row_date == target_date:
-            return row_num
-    return None
+def _upsert_v2(wb, firm_name: str, rows: list[dict]) -> list[str]:
+    """Upsert rows into a v2 two-sheet workbook (in memory; caller saves).
 
+    Splits each row across cases + appearances.
+    """
+    ws_cases = wb["cases"]
+    case_headers = [cell.value for cell in ws_cases[1]]
+    case_col_of = {name: i for i, name in enumerate(case_headers, start=1)}
+    ws_app = wb["appearances"]
+    app_headers = [cell.value for cell in ws_app[1]]
+    app_col_of = {name: i for i, name in enumerate(app_headers, start=1)}
 
-def _match_case_by_index(ws_cases, case_headers: list[str], index_number: str) -> int | None:
-    """Return the Excel row number of a case matching index_number, or None."""
+    # index_number -> (Excel row number, case_id)
     idx_col = case_headers.index("index_number")
-    target = index_number.strip().lower()
-
+    cid_col = case_headers.index("case_id")
+    case_by_index: dict[str, tuple[int, str]] = {}
     for row_num, row in enumerate(ws_cases.iter_rows(min_row=2, values_only=True), start=2):
-        if str(row[idx_col] or "").strip().lower() == target:
-            return row_num
-    return None
+        case_by_index.setdefault(
+            str(row[idx_col] or "").strip().lower(), (row_num, str(row[cid_col]))
+        )
 
+    # (case_id, appearance_date) -> Excel row number
+    app_cid_col = app_headers.index("case_id")
+    app_date_col = app_headers.index("appearance_date")
+    app_by_key: dict[tuple[str, str], int] = {}
+    for row_num, row in enumerate(ws_app.iter_rows(min_row=2, values_only=True), start=2):
+        key = (str(row[app_cid_col] or "").strip(), str(row[app_date_col] or ""))
+        app_by_key.setdefault(key, row_num)
+
+    actions: list[str] = []
+    for row_data in rows:
+        case_fields, app_fields = _split_row_data(row_data, firm_name)
+        idx_key = str(row_data.get("index_number", "")).strip().lower()
+        app_date = str(row_data.get("appearance_date", ""))
+
+        # Find or create case
+        existing_case = case_by_index.get(idx_key)
+        if existing_case is not None:
+            # Update existing case fields
+            case_row_num, case_id = existing_case
+            for col_name, value in case_fields.items():
+                if col_name in case_col_of:
+                    ws_cases.cell(row=case_row_num, column=case_col_of[col_name], value=value)
+        else:
+            # Insert new case
+            case_id = str(uuid.uuid4())
+            case_fields["case_id"] = case_id
+            if "date_added" not in case_fields:
+                case_fields["date_added"] = date.today().isoformat()
+            ws_cases.append([case_fields.get(col) for col in case_headers])
+            case_by_index[idx_key] = (ws_cases.max_row, case_id)
+
+        # Find or create appearance
+        app_row_num = app_by_key.get((case_id, app_date))
+        if app_row_num is not None:
+            # Update existing appearance
+            for col_name, value in app_fields.items():
+                if col_name in app_col_of:
+                    ws_app.cell(row=app_row_num, column=app_col_of[col_name], value=value)
+            actions.append("updated")
+        else:
+            # Insert new appearance
+            app_fields["appearance_id"] = str(uuid.uuid4())
+            app_fields["case_id"] = case_id
+            ws_app.append([app_fields.get(col) for col in app_headers])
+            app_by_key[(case_id, app_date)] = ws_app.max_row
+            actions.append("inserted")
+    return actions
 
-def _upsert_v1(wb, path, row_data: dict) -> str:
-    """Upsert into a v1 single-sheet workbook."""
-    ws = wb["cases"]
-    headers = [cell.value for cell in ws[1]]
 
-    idx_num = str(row_data.get("index_number", ""))
-    app_date = str(row_data.get("appearance_date", ""))
-    existing_row = _match_key(ws, headers, idx_num, app_date)
+def upsert_rows(firm_name: str, rows: list[dict], _hold_lock: bool = True) -> list[str]:
+    """Insert or update many rows in a firm's dataset with a single load + save.
 
-    if existing_row is not None:
-        for col_name, value in row_data.items():
-            if col_name in headers:
-                col_idx = headers.index(col_name) + 1
-                ws.cell(row=existing_row, column=col_idx, value=value)
-        wb.save(path)
-        wb.close()
-        return "updated"
-    else:
-        new_row = [row_data.get(col) for col in headers]
-        ws.append(new_row)
-        wb.save(path)
-        wb.close()
-        return "inserted"
+    Same semantics as calling upsert_row() for each row in order.
+    Returns one "inserted" / "updated" action per row.
+    """
+    from src.file_lock import FirmFileLock
 
+    path = dataset_path(firm_name)
 
-def _upsert_v2(wb, path, firm_name: str, row_data: dict) -> str:
-    """Upsert into a v2 two-sheet workbook. Splits data across cases + appearances."""
-    case_fields, app_fields = _split_row_data(row_data, firm_name)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Dataset not found: {path}\n"
+            "Run 'python -m src.main init-dataset' first."
+        )
 
-    ws_cases = wb["cases"]
-    case_headers = [cell.value for cell in ws_cases[1]]
-    ws_app = wb["appearances"]
-    app_headers = [cell.value for cell in ws_app[1]]
+    lock = FirmFileLock(firm_name) if _hold_lock else contextlib.nullcontext()
 
-    idx_num = str(row_data.get("index_number", ""))
-    app_date = str(row_data.get("appearance_date", ""))
-
-    # Find or create case
-    case_row_num = _match_case_by_index(ws_cases, case_headers, idx_num)
-    if case_row_num is not None:
-        # Update existing case fields
-        case_id_col = case_headers.index("case_id") + 1
-        case_id = str(ws_cases.cell(row=case_row_num, column=case_id_col).value)
-        for col_name, value in case_fields.items():
-            if col_name in case_headers:
-                col_idx = case_headers.index(col_name) + 1
-                ws_cases.cell(row=case_row_num, column=col_idx, value=value)
-    else:
-        # Insert new case
-        case_id = str(uuid.uuid4())
-        case_fields["case_id"] = case_id
-        if "date_added" not in case_fields:
-            case_fields["date_added"] = date.today().isoformat()
-        new_case_row = [case_fields.get(col) for col in case_headers]
-        ws_cases.append(new_case_row)
-
-    # Find or create appearance
-    app_row_num = _match_appearance(ws_app, app_headers, case_id, app_date)
-    if app_row_num is not None:
-        # Update existing appearance
-        for col_name, value in app_fields.items():
-            if col_name in app_headers:
-                col_idx = app_headers.index(col_name) + 1
-                ws_app.cell(row=app_row_num, column=col_idx, value=value)
-        wb.save(path)
-        wb.close()
-        return "updated"
-    else:
-        # Insert new appearance
-        app_fields["appearance_id"] = str(uuid.uuid4())
-        app_fields["case_id"] = case_id
-        new_app_row = [app_fields.get(col) for col in app_headers]
-        ws_app.append(new_app_row)
-        wb.save(path)
-        wb.close()
-        return "inserted"
+    with lock:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path)
+        try:
+            if _is_v2_format(wb):
+                actions = _upsert_v2(wb, firm_name, rows)
+            else:
+                actions = _upsert_v1(wb, rows)
+            if rows:
+                wb.save(path)
+                invalidate_dataset_cache(path)
+        finally:
+            wb.close()
+    return actions
 
 
 def upsert_row(firm_name: str, row_data: dict, _hold_lock: bool = True) -> str:
@@ -805,29 +931,80 @@ def upsert_row(firm_name: str, row_data: dict, _hold_lock: bool = True) -> str:
 
     Returns "inserted" or "updated".
     """
-    from src.file_lock import FirmFileLock
+    return upsert_rows(firm_name, [row_data], _hold_lock=_hold_lock)[0]
 
-    path = dataset_path(firm_name)
 
-    if not path.exists():
-        raise FileNotFoundError(
-            f"Dataset not found: {path}\n"
-            "Run 'python -m src.main init-dataset' first."
-        )
+# ── Batched writes ────────────────────────────────────────────────────
 
-    lock = FirmFileLock(firm_name) if _hold_lock else contextlib.nullcontext()
+# Per-thread queue of pending writes while inside batch_writes():
+# {firm_name: {row_key: merged row_data}}, or None outside a batch.
+_batch = threading.local()
 
-    with lock:
-        wb = load_workbook(path)
 
-        if _is_v2_format(wb):
-            return _upsert_v2(wb, path, firm_name, row_data)
-        else:
-            return _upsert_v1(wb, path, row_data)
+@contextlib.contextmanager
+def batch_writes():
+    """Coalesce write_row() calls into a single workbook save per firm.
+
+    Writes queued inside the block are flushed via upsert_rows() on exit,
+    including when the block raises (callers may already have audited
+    them).  Nested blocks join the outermost one.
+    """
+    if getattr(_batch, "pending", None) is not None:
+        yield
+        return
+
+    _batch.pending = {}
+    try:
+        yield
+    finally:
+        pending, _batch.pending = _batch.pending, None
+        for firm_name, by_key in pending.items():
+            upsert_rows(firm_name, list(by_key.values()))
+
+
+def write_row(firm_name: str, row_data: dict) -> None:
+    """Upsert a row now, or queue it when inside batch_writes().
+
+    Queued writes to the same key are merged, and find_row_by_key() sees
+    them before they are flushed.
+    """
+    pending = getattr(_batch, "pending", None)
+    if pending is None:
+        upsert_row(firm_name, row_data)
+        return
+    key = row_key(row_data.get("index_number", ""), row_data.get("appearance_date", ""))
+    pending.setdefault(firm_name, {}).setdefault(key, {}).update(row_data)
+
+
+def _queued_update(firm_name: str, key: tuple[str, str]) -> dict | None:
+    pending = getattr(_batch, "pending", None)
+    if not pending or firm_name not in pending:
+        return None
+    return pending[firm_name].get(key)
 
 
 # ── Query ─────────────────────────────────────────────────────────────
 
+# Same inputs strptime(s, "%Y-%m-%d") accepts, without its per-call
+# format parsing and exception cost on every row.
+_YMD_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+# User-entered dates must be zero-padded
+_YMD_STRICT_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+def _parse_ymd(text: str, strict: bool = False) -> date | None:
+    """Parse a YYYY-MM-DD string, or None.
+
+    Month and day may be unpadded unless *strict* is set.
+    """
+    m = (_YMD_STRICT_RE if strict else _YMD_RE).fullmatch(text)
+    if m is None:
+        return None
+    try:
+        return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    except ValueError:
+        return None
+
 
 def _to_date(val) -> date | None:
     """Coerce a value to a date object, or None."""
@@ -837,10 +1014,29 @@ def _to_date(val) -> date | None:
         return val.date()
     if isinstance(val, date):
         return val
-    try:
-        return datetime.strptime(str(val).split(" ")[0], "%Y-%m-%d").date()
-    except (ValueError, TypeError):
-        return None
+    return _parse_ymd(str(val).split(" ")[0])
+
+
+def _dated_rows(firm_name: str) -> list[tuple[date, dict]]:
+    """Return ``(appearance date, row)`` for a firm's dated rows, sorted by date.
+
+    Dates are parsed once per load of the dataset rather than on every
+    query.  Rows are shared with the cache, so copy one before mutating it.
+    """
+    path = dataset_path(firm_name)
+    rows = _cached_rows(firm_name)[1]
+    cached = _dated_cache.get(path)
+    if cached is not None and cached[0] is rows:
+        return cached[1]
+
+    dated = []
+    for row in rows:
+        d = _to_date(row.get("appearance_date"))
+        if d is not None:
+            dated.append((d, row))
+    dated.sort(key=lambda pair: pair[0])  # stable: file order within a day
+    _dated_cache[path] = (rows, dated)
+    return dated
 
 
 def query_by_date_range(
@@ -851,7 +1047,10 @@ def query_by_date_range(
 ) -> list[dict]:
     """Return rows whose appearance_date falls within [start, end] inclusive."""
     if rows is None:
-        rows = load_dataset(firm_name)
+        dated = _dated_rows(firm_name)
+        lo = bisect_left(dated, start, key=lambda pair: pair[0])
+        hi = bisect_right(dated, end, key=lambda pair: pair[0])
+        return [dict(row) for _, row in dated[lo:hi]]
 
     result = []
     for row in rows:
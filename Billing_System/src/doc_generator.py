@@ -2,25 +2,45 @@
 
 Uses template/perdiem.docx as the single template for per-case invoices.
 Replaces [[placeholder]] tokens in runs, preserving formatting.
-Converts the filled .docx to .pdf via docx2pdf (Word COM on Windows).
+Converts the filled .docx to .pdf via src.pdf_convert (Word COM on Windows).
 
 Output structure:
     invoice/{FirmName}/{YYYY}/{Mon}/Week of MM-DD-YYYY/report/word/MM-DD-YYYY Case Name.docx
     invoice/{FirmName}/{YYYY}/{Mon}/Week of MM-DD-YYYY/report/pdf/MM-DD-YYYY Case Name.pdf
 """
 
-from datetime import datetime
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 
 from docx import Document
-from docx2pdf import convert
 
 from src.config import get_firm, load_config
 from src.dataset import find_row_by_key, get_data_root, week_range, PROJECT_ROOT
+from src.pdf_convert import convert_many
 
 TEMPLATE_PATH = PROJECT_ROOT / "template" / "perdiem.docx"
 
 
+# ── Template loading ─────────────────────────────────────────────────
+
+def open_template(path: Path) -> Document:
+    """Open a fresh Document from a .docx template.
+
+    The file bytes are cached (keyed on mtime and size, so edits to the
+    template are picked up); each call parses its own independent copy.
+    """
+    st = Path(path).stat()
+    return Document(BytesIO(_template_bytes(str(path), st.st_mtime_ns, st.st_size)))
+
+
+@lru_cache(maxsize=8)
+def _template_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    return Path(path).read_bytes()
+
+
 # ── Date formatting ──────────────────────────────────────────────────
 
 def _ordinal(day: int) -> str:
@@ -40,6 +60,12 @@ def _format_date_display(date_str: str) -> str:
     return f"{dt.strftime('%B')} {_ordinal(dt.day)}, {dt.year}"
 
 
+@lru_cache(maxsize=4096)
+def _fmt_mdy(d: date) -> str:
+    """Format a date as MM/DD/YYYY (cached — court days repeat often)."""
+    return d.strftime("%m/%d/%Y")
+
+
 def _parse_date(date_str) -> datetime:
     """Parse a date string or datetime into a datetime object."""
     if isinstance(date_str, datetime):
@@ -76,17 +102,33 @@ def _build_placeholder_map(case: dict, firm: dict) -> dict[str, str]:
 
 # ── Fill template ────────────────────────────────────────────────────
 
+@lru_cache(maxsize=32)
+def _token_pattern(tokens: tuple[str, ...]) -> re.Pattern:
+    # Longest first so a token never loses to one of its own prefixes
+    return re.compile("|".join(map(re.escape, sorted(tokens, key=len, reverse=True))))
+
+
+def _replace_many(text: str, placeholders: dict[str, str]) -> str:
+    """Replace every placeholder token in *text* in a single pass."""
+    if not placeholders:
+        return text
+    pattern = _token_pattern(tuple(placeholders))
+    return pattern.sub(lambda m: placeholders[m.group(0)], text)
+
+
 def _replace_in_runs(paragraph, placeholders: dict[str, str]) -> None:
     """Replace [[placeholder]] tokens in a paragraph's runs."""
-    for run in paragraph.runs:
-        for token, value in placeholders.items():
-            if token in run.text:
-                run.text = run.text.replace(token, value)
+    for run in paragraph._p.r_lst:
+        text = run.text
+        if "[[" in text:
+            new_text = _replace_many(text, placeholders)
+            if new_text != text:
+                run.text = new_text
 
 
 def fill_template(case: dict, firm: dict, output_docx: Path) -> Path:
     """Fill the perdiem.docx template with case data and save to output_docx."""
-    doc = Document(str(TEMPLATE_PATH))
+    doc = open_template(TEMPLATE_PATH)
     placeholders = _build_placeholder_map(case, firm)
 
     for paragraph in doc.paragraphs:
@@ -108,8 +150,7 @@ def fill_template(case: dict, firm: dict, output_docx: Path) -> Path:
 
 def convert_to_pdf(docx_path: Path, pdf_path: Path) -> Path:
     """Convert a .docx file to .pdf using Word COM. Returns the PDF path."""
-    pdf_path.parent.mkdir(parents=True, exist_ok=True)
-    convert(str(docx_path), str(pdf_path))
+    convert_many([(docx_path, pdf_path)])
     return pdf_path
 
 
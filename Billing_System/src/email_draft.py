@@ -19,12 +19,28 @@ OL_MAIL_ITEM = 0
 OL_FORMAT_HTML = 2
 
 
+def connect_outlook():
+    """Return the Outlook.Application COM object.
+
+    Pass it to ``create_draft(outlook=...)`` to reuse one connection for
+    several drafts.  Raises OSError if Outlook cannot be reached.
+    """
+    try:
+        return win32com.client.Dispatch("Outlook.Application")
+    except Exception as exc:
+        raise OSError(
+            "Could not connect to Outlook. Is it running?\n"
+            f"  Detail: {exc}"
+        ) from exc
+
+
 def create_draft(
     to: str,
     subject: str,
     body_html: str,
     cc: str | None = None,
     attachment_paths: list[str | Path] | None = None,
+    outlook=None,
 ) -> dict:
     """Create an Outlook draft email and save it to the Drafts folder.
 
@@ -40,6 +56,9 @@ def create_draft(
         CC email address(es), semicolon-separated.
     attachment_paths : list | None
         Paths to files to attach (typically PDFs).
+    outlook : COM object | None
+        An existing connection from ``connect_outlook()``; a new one is
+        made when omitted.
 
     Returns
     -------
@@ -61,13 +80,8 @@ def create_draft(
             raise FileNotFoundError(f"Attachment not found: {path}")
         resolved.append(path)
 
-    try:
-        outlook = win32com.client.Dispatch("Outlook.Application")
-    except Exception as exc:
-        raise OSError(
-            "Could not connect to Outlook. Is it running?\n"
-            f"  Detail: {exc}"
-        ) from exc
+    if outlook is None:
+        outlook = connect_outlook()
 
     mail = outlook.CreateItem(OL_MAIL_ITEM)
     mail.To = to
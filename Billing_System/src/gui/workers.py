@@ -37,9 +37,12 @@ class ServiceWorker(QRunnable):
         # COM initialisation — needed when Word / Outlook COM objects are
         # created from a background thread (QThreadPool worker).
         import pythoncom
+        from src.pdf_convert import word_session
         pythoncom.CoInitialize()
         try:
-            result = self.fn(*self.args, **self.kwargs)
+            # One Word instance for every PDF conversion in this job
+            with word_session():
+                result = self.fn(*self.args, **self.kwargs)
             self.signals.finished.emit(result)
         except Exception:
             self.signals.error.emit(
@@ -6,13 +6,14 @@ Counter resets each year when yearly_reset is true.
 """
 
 import json
+import os
 from datetime import date
 from pathlib import Path
 
 from openpyxl import load_workbook
 
 from src.config import CONFIG_PATH, load_config, get_firm
-from src.dataset import dataset_path, get_data_root, _is_v2_format
+from src.dataset import dataset_path, get_data_root, invalidate_dataset_cache, _is_v2_format
 
 
 def _counter_path(firm_name: str) -> Path:
@@ -29,41 +30,50 @@ def _load_counter(firm_name: str) -> dict:
 
 
 def _save_counter(firm_name: str, counter: dict) -> None:
+    """Write the counter atomically so a crash never leaves a truncated file."""
     path = _counter_path(firm_name)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(counter, f, indent=2)
+    os.replace(tmp, path)
 
 
-def next_invoice_number(firm_name: str, config: dict | None = None) -> str:
-    """Generate the next invoice number for a firm and persist the counter.
-
-    Uses the format and yearly_reset settings from config.
-    """
-    if config is None:
-        config = load_config()
-
-    firm = get_firm(firm_name, config)
-    initials = firm["initials"]
+def _number_issuer(firm_name: str, config: dict, counter: dict):
+    """Return a callable that advances *counter* in memory and formats the number."""
+    initials = get_firm(firm_name, config)["initials"]
     numbering = config.get("invoice_numbering", {})
     fmt = numbering.get("format", "{initials}{year}{number:03d}")
     yearly_reset = numbering.get("yearly_reset", True)
 
-    counter = _load_counter(firm_name)
     current_year = date.today().year
-
     if yearly_reset and counter["year"] != current_year:
         counter["year"] = current_year
         counter["last_number"] = 0
 
-    counter["last_number"] += 1
-    _save_counter(firm_name, counter)
+    def issue() -> str:
+        counter["last_number"] += 1
+        return fmt.format(
+            initials=initials,
+            year=counter["year"],
+            number=counter["last_number"],
+        )
 
-    return fmt.format(
-        initials=initials,
-        year=counter["year"],
-        number=counter["last_number"],
-    )
+    return issue
+
+
+def next_invoice_number(firm_name: str, config: dict | None = None) -> str:
+    """Generate the next invoice number for a firm and persist the counter.
+
+    Uses the format and yearly_reset settings from config.
+    """
+    if config is None:
+        config = load_config()
+
+    counter = _load_counter(firm_name)
+    inv_num = _number_issuer(firm_name, config, counter)()
+    _save_counter(firm_name, counter)
+    return inv_num
 
 
 def assign_invoice_numbers(firm_name: str, config: dict | None = None) -> list[str]:
@@ -96,6 +106,9 @@ def assign_invoice_numbers(firm_name: str, config: dict | None = None) -> list[s
         headers = [cell.value for cell in ws[1]]
         inv_col = headers.index("invoice_number") + 1  # 1-based
 
+        # Load the counter once and persist it once for the whole batch.
+        counter = _load_counter(firm_name)
+        issue = _number_issuer(firm_name, config, counter)
         assigned: list[str] = []
 
         for row_num, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
@@ -103,10 +116,18 @@ def assign_invoice_numbers(firm_name: str, config: dict | None = None) -> list[s
                 continue
             current_inv = row[inv_col - 1]  # 0-based for tuple
             if current_inv is None or str(current_inv).strip() == "":
-                inv_num = next_invoice_number(firm_name, config)
+                inv_num = issue()
                 ws.cell(row=row_num, column=inv_col, value=inv_num)
                 assigned.append(inv_num)
 
+        if not assigned:
+            wb.close()
+            return assigned
+
+        # Counter first: a crash before the workbook save skips numbers
+        # rather than reissuing them.
+        _save_counter(firm_name, counter)
         wb.save(path)
         wb.close()
+        invalidate_dataset_cache(path)
     return assigned
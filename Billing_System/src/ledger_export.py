@@ -11,18 +11,14 @@ Output structure:
 from datetime import date
 from pathlib import Path
 
-from docx import Document
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.shared import Inches, Pt
-from docx2pdf import convert
 from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill, numbers
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
 
 from src.config import load_config
 from src.dataset import PROJECT_ROOT, get_data_root, load_dataset, _to_date
-from src.doc_generator import _ordinal
+from src.doc_generator import _fmt_mdy, _ordinal
 
 
 # ── Aging buckets ────────────────────────────────────────────────────
@@ -81,6 +77,11 @@ def _build_ledger_doc(
     output_docx: Path,
 ) -> Path:
     """Create the ledger .docx and save it."""
+    from docx import Document
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches, Pt
+
     doc = Document()
 
     for section in doc.sections:
@@ -116,6 +117,8 @@ def _build_ledger_doc(
     table = doc.add_table(rows=1, cols=len(TABLE_COLUMNS))
     table.style = "Light Grid Accent 1"
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    # Set the 8pt cell font once on the table style instead of per run
+    table.style.font.size = Pt(8)
 
     for i, name in enumerate(TABLE_COLUMNS):
         cell = table.rows[0].cells[i]
@@ -124,18 +127,23 @@ def _build_ledger_doc(
             p.alignment = WD_ALIGN_PARAGRAPH.CENTER
             for r in p.runs:
                 r.bold = True
-                r.font.size = Pt(8)
 
     for i, w in enumerate(COL_WIDTHS):
         table.columns[i].width = Inches(w)
 
+    # Amount right-aligned; Paid and Payment Date centered; rest left
+    left, center, right = (
+        WD_ALIGN_PARAGRAPH.LEFT, WD_ALIGN_PARAGRAPH.CENTER, WD_ALIGN_PARAGRAPH.RIGHT,
+    )
+    col_align = (left, left, left, left, left, left, right, center, center)
+
     total_billed = 0.0
     total_paid = 0.0
 
     for case in cases:
         row = table.add_row()
         d = _to_date(case.get("appearance_date"))
-        date_str = d.strftime("%m/%d/%Y") if d else ""
+        date_str = _fmt_mdy(d) if d else ""
         amt = float(case.get("charge_amount") or 0)
         total_billed += amt
 
@@ -149,7 +157,7 @@ def _build_ledger_doc(
             paid_display = ""
 
         pay_date = _to_date(case.get("payment_date"))
-        pay_date_str = pay_date.strftime("%m/%d/%Y") if pay_date else ""
+        pay_date_str = _fmt_mdy(pay_date) if pay_date else ""
 
         values = [
             date_str,
@@ -162,18 +170,10 @@ def _build_ledger_doc(
             paid_display,
             pay_date_str,
         ]
-        for i, val in enumerate(values):
-            cell = row.cells[i]
+        for cell, val, align in zip(row.cells, values, col_align):
             cell.text = val
             for p in cell.paragraphs:
-                if i == 6:  # Amount
-                    p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                elif i in (7, 8):  # Paid, Payment Date
-                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                else:
-                    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                for r in p.runs:
-                    r.font.size = Pt(8)
+                p.alignment = align
 
     # Total row
     total_row = table.add_row()
@@ -185,14 +185,12 @@ def _build_ledger_doc(
                 p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
                 for r in p.runs:
                     r.bold = True
-                    r.font.size = Pt(8)
         elif i == 6:
             cell.text = f"${total_billed:,.2f}"
             for p in cell.paragraphs:
                 p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
                 for r in p.runs:
                     r.bold = True
-                    r.font.size = Pt(8)
 
     # Summary
     doc.add_paragraph()
@@ -268,56 +266,83 @@ HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="s
 HEADER_FONT = Font(bold=True, color="FFFFFF", size=10)
 
 
+def _wo_cell(ws, value, font=None, fill=None, alignment=None, number_format=None):
+    """Build a styled cell for a write-only worksheet."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
 def _build_ledger_xlsx(
     firm_name: str,
     as_of: date,
     cases: list[dict],
     output_xlsx: Path,
 ) -> Path:
-    """Create the ledger .xlsx and save it."""
+    """Create the ledger .xlsx and save it.
+
+    Uses a write-only workbook so memory stays flat for long histories;
+    rows are streamed top to bottom with ``ws.append``.
+    """
     from src.dataset import COLUMNS  # dataset column keys
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Ledger"
+    date_cols = frozenset(
+        i for i, k in enumerate(COLUMNS, start=1) if k.endswith("_date")
+    )
+    amt_col = COLUMNS.index("charge_amount") + 1
 
-    # Header row
-    for col_idx, name in enumerate(XLSX_COLUMNS, start=1):
-        cell = ws.cell(row=1, column=col_idx, value=name)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = Alignment(horizontal="center")
-
-    # Data rows
-    for row_idx, case in enumerate(cases, start=2):
+    # Data rows (values only — styled when appended)
+    data_rows: list[list] = []
+    for case in cases:
+        values = []
         for col_idx, col_key in enumerate(COLUMNS, start=1):
             val = case.get(col_key)
-            # Format dates as strings for readability
-            d = _to_date(val) if col_key.endswith("_date") else None
-            if d is not None:
-                val = d.strftime("%m/%d/%Y")
-            elif col_key == "charge_amount" and val is not None:
+            if col_idx in date_cols:
+                # Format dates as strings for readability
+                d = _to_date(val)
+                if d is not None:
+                    val = _fmt_mdy(d)
+            elif col_idx == amt_col and val is not None:
                 val = float(val)
-            ws.cell(row=row_idx, column=col_idx, value=val)
+            values.append(val)
+        data_rows.append(values)
 
-    # Format charge_amount column as currency
-    amt_col = COLUMNS.index("charge_amount") + 1
-    for row_idx in range(2, len(cases) + 2):
-        ws.cell(row=row_idx, column=amt_col).number_format = '$#,##0.00'
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Ledger")
 
-    # Auto-width columns
+    # Auto-width columns (sampled from the first rows)
     for col_idx in range(1, len(XLSX_COLUMNS) + 1):
-        letter = get_column_letter(col_idx)
         max_len = len(XLSX_COLUMNS[col_idx - 1])
-        for row_idx in range(2, min(len(cases) + 2, 50)):
-            val = ws.cell(row=row_idx, column=col_idx).value
+        for values in data_rows[:48]:
+            val = values[col_idx - 1]
             if val is not None:
                 max_len = max(max_len, len(str(val)))
-        ws.column_dimensions[letter].width = min(max_len + 3, 40)
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(max_len + 3, 40)
+
+    ws.freeze_panes = "A2"
+
+    # Header row
+    header_align = Alignment(horizontal="center")
+    ws.append([
+        _wo_cell(ws, name, font=HEADER_FONT, fill=HEADER_FILL, alignment=header_align)
+        for name in XLSX_COLUMNS
+    ])
+
+    # Charge amount formatted as currency
+    for values in data_rows:
+        values[amt_col - 1] = _wo_cell(ws, values[amt_col - 1], number_format="$#,##0.00")
+        ws.append(values)
 
     # Summary rows below data
-    summary_row = len(cases) + 3
-    ws.cell(row=summary_row, column=1, value="Summary").font = Font(bold=True, size=11)
+    ws.append([])
+    ws.append([_wo_cell(ws, "Summary", font=Font(bold=True, size=11))])
 
     total_billed = sum(float(c.get("charge_amount") or 0) for c in cases)
     total_paid = sum(
@@ -326,34 +351,24 @@ def _build_ledger_xlsx(
     )
     outstanding = total_billed - total_paid
 
-    for i, (label, value) in enumerate([
+    bold = Font(bold=True)
+    for label, value in [
         ("Total Cases", len(cases)),
         ("Total Billed", total_billed),
         ("Total Paid", total_paid),
         ("Outstanding", outstanding),
-    ]):
-        r = summary_row + 1 + i
-        ws.cell(row=r, column=1, value=label).font = Font(bold=True)
-        cell = ws.cell(row=r, column=2, value=value)
-        if isinstance(value, float):
-            cell.number_format = '$#,##0.00'
+    ]:
+        fmt = "$#,##0.00" if isinstance(value, float) else None
+        ws.append([_wo_cell(ws, label, font=bold), _wo_cell(ws, value, number_format=fmt)])
 
     # Aging analysis
     aging = _compute_aging(cases, as_of)
-    aging_row = summary_row + 6
-    ws.cell(row=aging_row, column=1, value="Aging Analysis (Outstanding)").font = Font(bold=True, size=11)
-    ws.cell(row=aging_row + 1, column=1, value="Period").font = Font(bold=True)
-    ws.cell(row=aging_row + 1, column=2, value="Cases").font = Font(bold=True)
-    ws.cell(row=aging_row + 1, column=3, value="Amount").font = Font(bold=True)
-
-    for i, (label, count, total) in enumerate(aging):
-        r = aging_row + 2 + i
-        ws.cell(row=r, column=1, value=label)
-        ws.cell(row=r, column=2, value=count)
-        cell = ws.cell(row=r, column=3, value=total)
-        cell.number_format = '$#,##0.00'
+    ws.append([])
+    ws.append([_wo_cell(ws, "Aging Analysis (Outstanding)", font=Font(bold=True, size=11))])
+    ws.append([_wo_cell(ws, h, font=bold) for h in ("Period", "Cases", "Amount")])
 
-    ws.freeze_panes = "A2"
+    for label, count, total in aging:
+        ws.append([label, count, _wo_cell(ws, total, number_format="$#,##0.00")])
 
     output_xlsx.parent.mkdir(parents=True, exist_ok=True)
     wb.save(output_xlsx)
@@ -373,6 +388,8 @@ def export_ledger(
 
     Returns dict with keys 'pdf' and optionally 'xlsx'.
     """
+    from src.pdf_convert import convert_many
+
     if config is None:
         config = load_config()
     if as_of is None:
@@ -391,8 +408,7 @@ def export_ledger(
 
     # Build PDF via Word
     _build_ledger_doc(firm_name, as_of, cases, docx_out)
-    pdf_out.parent.mkdir(parents=True, exist_ok=True)
-    convert(str(docx_out), str(pdf_out))
+    convert_many([(docx_out, pdf_out)])
 
     if not keep_docx and docx_out.exists():
         docx_out.unlink()
@@ -13,39 +13,130 @@ e.g. "LT-306306-Q-LT Fake abc vs. Jake Banner, Tom Banner"
 """
 
 import re
-from datetime import datetime
+import zipfile
+from datetime import date
 from pathlib import Path
 
-from docx import Document
+from lxml import etree
 
-from src.dataset import upsert_row
+from src.dataset import upsert_rows
 
 
 # Pattern: index number is the leading alphanumeric-dash token(s)
 # e.g. "LT-306306-Q-LT", "12345/2026"
 _IDX_PATTERN = re.compile(r"^(\S+)\s*(.*)")
 
+# Line-item dates: M/D/YY or MM/DD/YYYY (e.g. "2/11/26", "02/11/2026")
+_DATE_PATTERN = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})$")
+
+# Characters stripped from amounts before float(): "$1,250.00" -> "1250.00"
+_AMOUNT_STRIP = str.maketrans("", "", ",$")
+
+
+def _parse_line_date(date_str: str) -> date | None:
+    """Parse a line-item date; two-digit years follow strptime's %y pivot."""
+    m = _DATE_PATTERN.match(date_str)
+    if not m:
+        return None
+    month, day, year = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    if len(m.group(3)) == 2:
+        year += 1900 if year >= 69 else 2000
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _paragraph_text(p) -> str:
+    """Text of a w:p element (runs, tabs and breaks), like python-docx's Paragraph.text."""
+    parts: list[str] = []
+    for el in p.iter(f"{_W}t", f"{_W}tab", f"{_W}br", f"{_W}cr"):
+        if el.tag == f"{_W}t":
+            parts.append(el.text or "")
+        elif el.tag == f"{_W}tab":
+            parts.append("\t")
+        else:
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _table_rows(tbl) -> list[list[str]]:
+    """Cell texts per row of a w:tbl element, as python-docx's row.cells gives them.
+
+    Horizontally merged cells repeat; a vertical-merge continuation cell
+    takes the text of the cell above it at the same grid column.
+    """
+    rows: list[list[str]] = []
+    above: dict[int, str] = {}  # grid column -> text of the cell starting there
+    for tr in tbl.iterchildren(f"{_W}tr"):
+        cells: list[str] = []
+        current: dict[int, str] = {}
+        before = tr.find(f"{_W}trPr/{_W}gridBefore")
+        col = int(before.get(f"{_W}val")) if before is not None else 0
+        for tc in tr.iterchildren(f"{_W}tc"):
+            vmerge = tc.find(f"{_W}tcPr/{_W}vMerge")
+            if vmerge is not None and vmerge.get(f"{_W}val", "continue") == "continue":
+                text = above.get(col, "")
+            else:
+                text = "\n".join(_paragraph_text(p) for p in tc.iterchildren(f"{_W}p"))
+            span = tc.find(f"{_W}tcPr/{_W}gridSpan")
+            n = int(span.get(f"{_W}val")) if span is not None else 1
+            cells.extend([text] * n)
+            current[col] = text
+            col += n
+        rows.append(cells)
+        above = current
+    return rows
+
+
+def _read_body_table(file_path: str | Path, table_idx: int) -> list[list[str]]:
+    """Stream word/document.xml and return the rows of the table_idx-th body table.
+
+    Parsing stops as soon as that table is complete; earlier tables are
+    discarded as they are passed, so memory does not grow with the document.
+    """
+    body_tag = f"{_W}body"
+    found = 0
+    try:
+        with zipfile.ZipFile(file_path) as z, z.open("word/document.xml") as f:
+            for _, el in etree.iterparse(f, events=("end",), tag=f"{_W}tbl"):
+                parent = el.getparent()
+                if parent is None or parent.tag != body_tag:
+                    continue  # nested table — handled with its outer table
+                if found == table_idx:
+                    return _table_rows(el)
+                found += 1
+                # Drop this table and everything before it
+                el.clear()
+                while el.getprevious() is not None:
+                    del parent[0]
+    except (zipfile.BadZipFile, KeyError) as exc:
+        raise ValueError(f"Not a valid .docx file: {file_path} ({exc})") from None
+
+    raise ValueError(
+        f"Expected at least {table_idx + 1} tables in legacy invoice, found {found}: {file_path}"
+    )
+
 
 def parse_legacy_invoice(file_path: str | Path) -> list[dict]:
     """Parse a legacy monthly invoice .docx and return a list of case dicts.
 
     Each dict has keys: appearance_date, index_number, case_caption, charge_amount.
     """
-    doc = Document(str(file_path))
-
-    if len(doc.tables) < 3:
-        raise ValueError(
-            f"Expected at least 3 tables in legacy invoice, found {len(doc.tables)}: {file_path}"
-        )
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
 
-    table = doc.tables[2]  # line items table
+    rows = _read_body_table(file_path, 2)  # line items table
     cases: list[dict] = []
 
-    for i, row in enumerate(table.rows):
+    for i, row in enumerate(rows):
         if i == 0:
             continue  # skip header row
 
-        cells = [c.text.strip() for c in row.cells]
+        cells = [c.strip() for c in row]
         if len(cells) < 5:
             continue
 
@@ -60,15 +151,11 @@ def parse_legacy_invoice(file_path: str | Path) -> list[dict]:
         # Parse date (formats: "2/11/26", "02/11/2026", etc.)
         if not date_str:
             continue
-        try:
-            dt = datetime.strptime(date_str, "%m/%d/%y")
-        except ValueError:
-            try:
-                dt = datetime.strptime(date_str, "%m/%d/%Y")
-            except ValueError:
-                continue  # skip rows with unparseable dates
+        dt = _parse_line_date(date_str)
+        if dt is None:
+            continue  # skip rows with unparseable dates
 
-        app_date = dt.strftime("%Y-%m-%d")
+        app_date = dt.isoformat()
 
         # Parse description: index_number + optional case caption
         m = _IDX_PATTERN.match(desc)
@@ -81,7 +168,7 @@ def parse_legacy_invoice(file_path: str | Path) -> list[dict]:
 
         # Parse amount (0 if empty)
         try:
-            charge = float(amount.replace(",", "").replace("$", "")) if amount else 0.0
+            charge = float(amount.translate(_AMOUNT_STRIP)) if amount else 0.0
         except (ValueError, AttributeError):
             charge = 0.0
 
@@ -102,16 +189,8 @@ def import_legacy_invoice(
     """Parse a legacy invoice and import cases into the firm's dataset.
 
     Returns list of (action, case_dict) where action is "inserted" or "updated".
-    Holds a single firm lock for the entire batch to avoid per-row lock overhead.
+    All cases are written in one batch (one lock, one load, one save).
     """
-    from src.file_lock import FirmFileLock
-
     cases = parse_legacy_invoice(file_path)
-    results: list[tuple[str, dict]] = []
-
-    with FirmFileLock(firm_name):
-        for case in cases:
-            action = upsert_row(firm_name, case, _hold_lock=False)
-            results.append((action, case))
-
-    return results
+    actions = upsert_rows(firm_name, cases)
+    return list(zip(actions, cases))
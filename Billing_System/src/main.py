@@ -3,9 +3,8 @@
 import click
 
 from src.config import load_config
-from src.dataset import COLUMNS, VALID_CASE_STATUSES
-from src.payment import VALID_STATUSES
-from src.services import case_service, doc_service, email_service, payment_service
+from src.dataset import VALID_CASE_STATUSES
+from src.payment import VALID_STATUSES_SORTED
 
 
 @click.group()
@@ -25,22 +24,23 @@ def config_check(ctx):
     """Load config and print a summary."""
     cfg = ctx.obj["config"]
 
-    click.echo("=== Config Check ===\n")
+    lines = ["=== Config Check ===\n"]
 
-    click.echo("Firms:")
+    lines.append("Firms:")
     for firm in cfg["firms"]:
-        click.echo(f"  - {firm['name']} ({firm['initials']})")
+        lines.append(f"  - {firm['name']} ({firm['initials']})")
 
-    click.echo(f"\nPaths:")
+    lines.append(f"\nPaths:")
     for label, path in cfg["paths"].items():
-        click.echo(f"  {label}: {path}")
+        lines.append(f"  {label}: {path}")
 
     numbering = cfg.get("invoice_numbering", {})
-    click.echo(f"\nInvoice numbering:")
-    click.echo(f"  format: {numbering.get('format', 'N/A')}")
-    click.echo(f"  yearly_reset: {numbering.get('yearly_reset', 'N/A')}")
+    lines.append(f"\nInvoice numbering:")
+    lines.append(f"  format: {numbering.get('format', 'N/A')}")
+    lines.append(f"  yearly_reset: {numbering.get('yearly_reset', 'N/A')}")
 
-    click.echo("\nConfig OK.")
+    lines.append("\nConfig OK.")
+    click.echo("\n".join(lines))
 
 
 # ── Phase 2: dataset commands ─────────────────────────────────────────
@@ -52,6 +52,8 @@ def config_check(ctx):
 @click.pass_context
 def init_dataset(ctx, firm, force):
     """Create master_cases.xlsx per firm (one file per law firm)."""
+    from src.services import case_service
+
     result = case_service.init_datasets(firm=firm, force=force, config=ctx.obj["config"])
     if not result.success:
         raise click.ClickException(result.message)
@@ -63,6 +65,8 @@ def init_dataset(ctx, firm, force):
 @click.pass_context
 def validate_dataset_cmd(ctx, firm):
     """Validate master_cases.xlsx for each firm."""
+    from src.services import case_service
+
     result = case_service.validate_datasets(firm=firm, config=ctx.obj["config"])
     click.echo(result.message)
     if not result.success:
@@ -86,6 +90,8 @@ def validate_dataset_cmd(ctx, firm):
 def add_case(ctx, firm, appearance_date, index_number, case_caption, charge_amount,
              court, outcome, case_status, notes):
     """Add or update a case in a firm's dataset."""
+    from src.services import case_service
+
     result = case_service.add_or_update_case(
         firm, appearance_date, index_number, case_caption, charge_amount,
         court=court, outcome=outcome, case_status=case_status, notes=notes,
@@ -104,6 +110,8 @@ def add_case(ctx, firm, appearance_date, index_number, case_caption, charge_amou
 @click.pass_context
 def assign_invoices(ctx, firm):
     """Assign invoice numbers to cases that don't have one yet."""
+    from src.services import case_service
+
     result = case_service.assign_invoices(firm=firm, config=ctx.obj["config"])
     if not result.success:
         raise click.ClickException(result.message)
@@ -121,6 +129,8 @@ def assign_invoices(ctx, firm):
 @click.pass_context
 def generate_daily(ctx, firm, index_number, appearance_date, keep_docx):
     """Generate a per-diem invoice PDF for a specific case."""
+    from src.services import doc_service
+
     result = doc_service.generate_daily(
         firm, index_number, appearance_date,
         keep_docx=keep_docx, config=ctx.obj["config"],
@@ -134,15 +144,25 @@ def generate_daily(ctx, firm, index_number, appearance_date, keep_docx):
 
 
 @cli.command("generate-weekly")
-@click.option("--firm", required=True, help="Law firm name.")
+@click.option("--firm", required=True, multiple=True, help="Law firm name (repeat for several firms).")
 @click.option("--week-of", required=True, help="Any date within the week (YYYY-MM-DD). Mon-Fri range is computed.")
 @click.option("--keep-docx", is_flag=True, help="Keep intermediate .docx file.")
+@click.option("--docx-only", is_flag=True, help="Write the .docx only; skip PDF conversion.")
 @click.pass_context
-def generate_weekly(ctx, firm, week_of, keep_docx):
-    """Generate a weekly statement of account for a firm."""
-    result = doc_service.generate_weekly(
-        firm, week_of, keep_docx=keep_docx, config=ctx.obj["config"],
-    )
+def generate_weekly(ctx, firm, week_of, keep_docx, docx_only):
+    """Generate a weekly statement of account for one or more firms."""
+    from src.services import doc_service
+
+    if len(firm) == 1:
+        result = doc_service.generate_weekly(
+            firm[0], week_of, keep_docx=keep_docx, config=ctx.obj["config"],
+            pdf=not docx_only,
+        )
+    else:
+        result = doc_service.generate_weekly_batch(
+            list(firm), week_of, keep_docx=keep_docx, config=ctx.obj["config"],
+            pdf=not docx_only,
+        )
     if not result.success:
         raise click.ClickException(result.message)
     click.echo(result.message)
@@ -152,16 +172,26 @@ def generate_weekly(ctx, firm, week_of, keep_docx):
 
 
 @cli.command("generate-monthly")
-@click.option("--firm", required=True, help="Law firm name.")
+@click.option("--firm", required=True, multiple=True, help="Law firm name (repeat for several firms).")
 @click.option("--year", required=True, type=int, help="Year (e.g. 2026).")
 @click.option("--month", required=True, type=int, help="Month number (1-12).")
 @click.option("--keep-docx", is_flag=True, help="Keep intermediate .docx file.")
+@click.option("--docx-only", is_flag=True, help="Write the .docx only; skip PDF conversion.")
 @click.pass_context
-def generate_monthly(ctx, firm, year, month, keep_docx):
-    """Generate a monthly statement of account for a firm."""
-    result = doc_service.generate_monthly(
-        firm, year, month, keep_docx=keep_docx, config=ctx.obj["config"],
-    )
+def generate_monthly(ctx, firm, year, month, keep_docx, docx_only):
+    """Generate a monthly statement of account for one or more firms."""
+    from src.services import doc_service
+
+    if len(firm) == 1:
+        result = doc_service.generate_monthly(
+            firm[0], year, month, keep_docx=keep_docx, config=ctx.obj["config"],
+            pdf=not docx_only,
+        )
+    else:
+        result = doc_service.generate_monthly_batch(
+            list(firm), year, month, keep_docx=keep_docx, config=ctx.obj["config"],
+            pdf=not docx_only,
+        )
     if not result.success:
         raise click.ClickException(result.message)
     click.echo(result.message)
@@ -178,6 +208,8 @@ def generate_monthly(ctx, firm, year, month, keep_docx):
 @click.pass_context
 def export_ledger_cmd(ctx, firm, asof, no_xlsx, keep_docx):
     """Export a firm's full-history master ledger (PDF + XLSX)."""
+    from src.services import doc_service
+
     result = doc_service.export_ledger(
         firm, as_of=asof, xlsx=not no_xlsx,
         keep_docx=keep_docx, config=ctx.obj["config"],
@@ -196,6 +228,8 @@ def export_ledger_cmd(ctx, firm, asof, no_xlsx, keep_docx):
 @click.pass_context
 def import_legacy(ctx, firm, file_path):
     """Import cases from a legacy monthly invoice .docx into a firm's dataset."""
+    from src.services import case_service
+
     result = case_service.import_legacy(firm, file_path, config=ctx.obj["config"])
     if not result.success:
         raise click.ClickException(result.message)
@@ -207,19 +241,29 @@ def import_legacy(ctx, firm, file_path):
 
 @cli.command("mark-paid")
 @click.option("--firm", required=True, help="Law firm name.")
-@click.option("--invoice", "invoice_number", required=True, help="Invoice number (e.g. AL2026001).")
-@click.option("--status", required=True, type=click.Choice(sorted(VALID_STATUSES), case_sensitive=False),
+@click.option("--invoice", "invoice_numbers", required=True, multiple=True,
+              help="Invoice number (e.g. AL2026001). Repeat to update several in one write.")
+@click.option("--status", required=True, type=click.Choice(VALID_STATUSES_SORTED, case_sensitive=False),
               help="Payment status.")
 @click.option("--date", "payment_date", default=None, help="Payment date (YYYY-MM-DD). Auto-set to today if marking Paid.")
 @click.option("--notes", default=None, help="Optional notes about the payment.")
 @click.pass_context
-def mark_paid(ctx, firm, invoice_number, status, payment_date, notes):
-    """Mark an invoice as Paid, Unpaid, or Partial."""
-    result = payment_service.mark_paid(
-        firm, invoice_number, status,
-        payment_date=payment_date, notes=notes,
-        config=ctx.obj["config"],
-    )
+def mark_paid(ctx, firm, invoice_numbers, status, payment_date, notes):
+    """Mark one or more invoices as Paid, Unpaid, or Partial."""
+    from src.services import payment_service
+
+    if len(invoice_numbers) == 1:
+        result = payment_service.mark_paid(
+            firm, invoice_numbers[0], status,
+            payment_date=payment_date, notes=notes,
+            config=ctx.obj["config"],
+        )
+    else:
+        result = payment_service.mark_paid_many(
+            firm, list(invoice_numbers), status,
+            payment_date=payment_date, notes=notes,
+            config=ctx.obj["config"],
+        )
     if not result.success:
         raise click.ClickException(result.message)
     click.echo(result.message)
@@ -228,7 +272,7 @@ def mark_paid(ctx, firm, invoice_number, status, payment_date, notes):
 # ── Phase 14: edit case field ─────────────────────────────────────────
 
 
-EDITABLE_FIELDS = sorted(["charge_amount", "court", "outcome", "case_status", "notes"])
+EDITABLE_FIELDS: tuple[str, ...] = ("case_status", "charge_amount", "court", "notes", "outcome")
 
 
 @cli.command("edit-case")
@@ -243,6 +287,8 @@ EDITABLE_FIELDS = sorted(["charge_amount", "court", "outcome", "case_status", "n
 @click.pass_context
 def edit_case(ctx, firm, index_number, appearance_date, field_name, new_value, reason):
     """Edit a single field on an existing case (with audit logging)."""
+    from src.services import case_service
+
     result = case_service.edit_case_field(
         firm, index_number, appearance_date, field_name, new_value,
         reason=reason, config=ctx.obj["config"],
@@ -262,6 +308,8 @@ def edit_case(ctx, firm, index_number, appearance_date, field_name, new_value, r
 @click.pass_context
 def draft_daily(ctx, firm, index_number, appearance_date):
     """Create an Outlook draft email for a daily per-diem invoice."""
+    from src.services import email_service
+
     result = email_service.draft_daily(
         firm, index_number, appearance_date, config=ctx.obj["config"],
     )
@@ -270,12 +318,28 @@ def draft_daily(ctx, firm, index_number, appearance_date):
     click.echo(result.message)
 
 
+@cli.command("draft-daily-batch")
+@click.option("--firm", required=True, help="Law firm name.")
+@click.option("--week-of", required=True, help="Any date within the week (YYYY-MM-DD).")
+@click.pass_context
+def draft_daily_batch(ctx, firm, week_of):
+    """Create Outlook drafts for every invoiced appearance in a week."""
+    from src.services import email_service
+
+    result = email_service.draft_daily_week(firm, week_of, config=ctx.obj["config"])
+    if not result.success:
+        raise click.ClickException(result.message)
+    click.echo(result.message)
+
+
 @cli.command("draft-weekly")
 @click.option("--firm", required=True, help="Law firm name.")
 @click.option("--week-of", required=True, help="Any date within the week (YYYY-MM-DD).")
 @click.pass_context
 def draft_weekly(ctx, firm, week_of):
     """Create an Outlook draft email for a weekly statement."""
+    from src.services import email_service
+
     result = email_service.draft_weekly(firm, week_of, config=ctx.obj["config"])
     if not result.success:
         raise click.ClickException(result.message)
@@ -289,6 +353,8 @@ def draft_weekly(ctx, firm, week_of):
 @click.pass_context
 def draft_monthly(ctx, firm, year, month):
     """Create an Outlook draft email for a monthly statement."""
+    from src.services import email_service
+
     result = email_service.draft_monthly(firm, year, month, config=ctx.obj["config"])
     if not result.success:
         raise click.ClickException(result.message)
@@ -306,6 +372,8 @@ def draft_monthly(ctx, firm, year, month):
 @click.pass_context
 def extract_firms(ctx, invoices_dir, output_path):
     """Scan invoice folders and extract firm contact metadata to a preview JSON."""
+    from src.services import case_service
+
     result = case_service.extract_firms(
         invoices_dir, output_path=output_path, config=ctx.obj["config"],
     )
@@ -325,6 +393,8 @@ def extract_firms(ctx, invoices_dir, output_path):
 @click.pass_context
 def bulk_import_cmd(ctx, firms_json, invoices_dir):
     """Bulk-import firms from extracted JSON and import all invoice cases."""
+    from src.services import case_service
+
     result = case_service.bulk_import(
         firms_json, invoices_dir, config=ctx.obj["config"],
     )
@@ -342,6 +412,8 @@ def bulk_import_cmd(ctx, firms_json, invoices_dir):
 @click.pass_context
 def migrate_v2(ctx, firm, dry_run):
     """Migrate firm dataset(s) from v1 (flat) to v2 (cases + appearances)."""
+    from src.services import case_service
+
     result = case_service.migrate_v2(
         firm=firm, dry_run=dry_run, config=ctx.obj["config"],
     )
@@ -351,4 +423,7 @@ def migrate_v2(ctx, firm, dry_run):
 
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    multiprocessing.freeze_support()  # per-firm process pools in frozen builds
     cli()
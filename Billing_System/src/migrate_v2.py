@@ -22,6 +22,7 @@ from src.dataset import (
     _is_v2_format,
     _write_sheet_headers,
     dataset_path,
+    invalidate_dataset_cache,
     validate_dataset,
     all_firm_names,
 )
@@ -63,7 +64,9 @@ def migrate_firm(firm_name: str, dry_run: bool = False) -> dict:
         return result
 
     with FirmFileLock(firm_name):
-        wb = load_workbook(path)
+        # Read-only first: already-migrated firms and dry runs never need
+        # the full editable workbook.
+        wb = load_workbook(path, read_only=True)
 
         # Already v2?
         if _is_v2_format(wb):
@@ -80,15 +83,15 @@ def migrate_firm(firm_name: str, dry_run: bool = False) -> dict:
             result["message"] = f"{firm_name}: missing 'cases' sheet."
             return result
 
-        ws_old = wb["cases"]
-        old_headers = [cell.value for cell in ws_old[1]]
-
         # Read all v1 rows
+        rows_iter = wb["cases"].iter_rows(values_only=True)
+        old_headers = list(next(rows_iter, ()))
         v1_rows: list[dict] = []
-        for row in ws_old.iter_rows(min_row=2, values_only=True):
+        for row in rows_iter:
             if all(v is None for v in row):
                 continue
             v1_rows.append(dict(zip(old_headers, row)))
+        wb.close()
 
         if dry_run:
             # Count what would be created
@@ -104,7 +107,6 @@ def migrate_firm(firm_name: str, dry_run: bool = False) -> dict:
                 f"{firm_name}: DRY RUN — would create {len(grouped)} case(s) "
                 f"and {len(v1_rows)} appearance(s) from {len(v1_rows)} v1 row(s)."
             )
-            wb.close()
             return result
 
         # Group v1 rows by index_number to create case records
@@ -160,7 +162,8 @@ def migrate_firm(firm_name: str, dry_run: bool = False) -> dict:
                 appearance_rows.append(app_row)
 
         # Rename old sheet to backup
-        ws_old.title = "cases_v1_backup"
+        wb = load_workbook(path)
+        wb["cases"].title = "cases_v1_backup"
 
         # Create new cases sheet
         ws_cases = wb.create_sheet("cases", 0)  # insert at position 0
@@ -176,9 +179,10 @@ def migrate_firm(firm_name: str, dry_run: bool = False) -> dict:
 
         wb.save(path)
         wb.close()
+        invalidate_dataset_cache(path)
 
     # Validate the result
-    errors = validate_dataset(firm_name)
+    errors, _ = validate_dataset(firm_name)
 
     result["status"] = "migrated"
     result["cases_created"] = len(case_rows)
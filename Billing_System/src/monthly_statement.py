@@ -9,18 +9,27 @@ Output structure:
     invoice/{FirmName}/{YYYY}/{Mon}/Monthly Statement {Mon} {YYYY}.pdf
 """
 
+import contextlib
 import copy
 from datetime import date
 from pathlib import Path
 
-from docx import Document
 from docx.shared import Pt
-from docx2pdf import convert
 
 from src.config import get_firm, load_config
-from src.dataset import PROJECT_ROOT, get_data_root, month_range, query_by_date_range, _to_date
-from src.doc_generator import _format_date_display
-from src.weekly_statement import _replace_in_paragraph, _set_cell_text, _clone_row, _clear_row
+from src.dataset import PROJECT_ROOT, get_data_root, month_range, query_by_date_range
+from src.doc_generator import _format_date_display, open_template
+from src.pdf_convert import convert_many
+from src.weekly_statement import (
+    _TOKEN_BODY_PARAGRAPHS,
+    _case_row_texts,
+    _clone_row,
+    _replace_in_element,
+    _background_writes,
+    _replace_in_p,
+    _save_docx,
+    _set_row_text,
+)
 
 TEMPLATE_PATH = PROJECT_ROOT / "template" / "monthly_statement.docx"
 
@@ -34,9 +43,10 @@ def _fill_monthly_template(
     cases: list[dict],
     firm: dict,
     output_docx: Path,
+    defer_write=None,
 ) -> Path:
     """Fill the monthly_statement.docx template and save."""
-    doc = Document(str(TEMPLATE_PATH))
+    doc = open_template(TEMPLATE_PATH)
 
     month_name = date(year, month, 1).strftime("%B")  # e.g. "February"
 
@@ -55,19 +65,17 @@ def _fill_monthly_template(
     }
 
     # Replace header/body placeholders
-    for paragraph in doc.paragraphs:
-        _replace_in_paragraph(paragraph, header_placeholders)
+    for p in _TOKEN_BODY_PARAGRAPHS(doc.element.body):
+        _replace_in_p(p, header_placeholders)
 
     # Also replace in table[0] (the "MONTHLY STATMENT" banner)
-    if doc.tables:
-        for row in doc.tables[0].rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    _replace_in_paragraph(paragraph, header_placeholders)
+    # (doc.tables wraps every body table on each access, so read it once)
+    tables = doc.tables
+    if tables:
+        _replace_in_element(tables[0]._tbl, header_placeholders)
 
     # ── Fill case table (table[1]) ───────────────────────────────────
-    case_table = doc.tables[1]
-    num_cols = 4  # Date, Index No., Case Caption, Amount
+    case_table = tables[1]
 
     # Template has: row 0 = header, row 1 = template data row,
     # rows 2-25 = empty, row 26 = total row.
@@ -77,64 +85,46 @@ def _fill_monthly_template(
     # If we need more rows than pre-allocated, clone the template row
     if len(cases) > pre_allocated:
         extra_needed = len(cases) - pre_allocated
-        for _ in range(extra_needed):
-            _clone_row(case_table, 1)
+        _clone_row(case_table, 1, extra_needed)
         total_row_idx = 1 + len(cases)
 
+    # Format all cell texts first, then write them
+    case_texts, total_fee = _case_row_texts(cases)
+
     # Fill case data into rows 1..N
-    total_fee = 0.0
-    for i, case in enumerate(cases):
-        row = case_table.rows[1 + i]
-        d = _to_date(case.get("appearance_date"))
-        date_str = d.strftime("%m/%d/%Y") if d else ""
-        amt = float(case.get("charge_amount") or 0)
-        total_fee += amt
-
-        _set_cell_text(row, 0, date_str)
-        _set_cell_text(row, 1, str(case.get("index_number") or ""))
-        _set_cell_text(row, 2, str(case.get("case_caption") or ""))
-        _set_cell_text(row, 3, f"${amt:,.2f}")
-
-    # Clear any unused pre-allocated rows
-    used_data_rows = len(cases)
-    total_data_slots = max(pre_allocated, len(cases))
-    for i in range(used_data_rows, total_data_slots):
-        row = case_table.rows[1 + i]
-        _clear_row(row, num_cols)
+    # (table.rows[i] rebuilds every row wrapper, so materialize them once)
+    rows = list(case_table.rows)
+    for row, texts in zip(rows[1:], case_texts):
+        _set_row_text(row, texts)
+
+    # Drop unused pre-allocated rows (fewer cases than slots) rather than
+    # blanking them cell by cell; the total row then follows the last case
+    for row in rows[1 + len(cases):1 + pre_allocated]:
+        case_table._tbl.remove(row._tr)
 
     # Replace [[total fee]] in the total row
-    total_row = case_table.rows[total_row_idx]
-    for cell in total_row.cells:
-        for paragraph in cell.paragraphs:
-            _replace_in_paragraph(paragraph, {
-                "[[total fee]]": f"{total_fee:,.2f}",
-            })
-
-    # Clear placeholder from template row 1 if no cases
-    if not cases:
-        row1 = case_table.rows[1]
-        for placeholder in ["[[case date]]", "[[case no]]", "[[case caption]]", "[[case fee]]"]:
-            for cell in row1.cells:
-                for paragraph in cell.paragraphs:
-                    _replace_in_paragraph(paragraph, {placeholder: ""})
-
-    output_docx.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(str(output_docx))
+    total_row = rows[total_row_idx]
+    _replace_in_element(total_row._tr, {
+        "[[total fee]]": f"{total_fee:,.2f}",
+    })
+
+    _save_docx(doc, output_docx, defer_write)
     return output_docx
 
 
 # ── Full pipeline ────────────────────────────────────────────────────
 
-def generate_monthly_statement(
+def render_monthly_statement(
     firm_name: str,
     year: int,
     month: int,
     config: dict | None = None,
-    keep_docx: bool = False,
-) -> Path:
-    """Generate a monthly statement PDF for a firm.
+    defer_write=None,
+) -> tuple[Path, Path]:
+    """Fill the monthly template for a firm without converting it.
 
-    Returns the path to the generated PDF.
+    Returns (docx_path, pdf_path) — the PDF path is where conversion should write.
+    With *defer_write* the .docx may not be on disk until that writer finishes.
     """
     if config is None:
         config = load_config()
@@ -156,14 +146,66 @@ def generate_monthly_statement(
     pdf_out = base_dir / f"{filename}.pdf"
 
     # Fill template
-    _fill_monthly_template(firm_name, year, month, cases, firm, docx_out)
+    _fill_monthly_template(
+        firm_name, year, month, cases, firm, docx_out, defer_write
+    )
+    return docx_out, pdf_out
+
+
+def generate_monthly_statement(
+    firm_name: str,
+    year: int,
+    month: int,
+    config: dict | None = None,
+    keep_docx: bool = False,
+    pdf: bool = True,
+) -> Path:
+    """Generate a monthly statement PDF for a firm.
+
+    Returns the path to the generated PDF (the .docx when ``pdf=False``).
+    """
+    return generate_monthly_statements(
+        [firm_name], year, month, config, keep_docx, pdf=pdf
+    )[firm_name]
+
+
+def generate_monthly_statements(
+    firm_names: list[str],
+    year: int,
+    month: int,
+    config: dict | None = None,
+    keep_docx: bool = False,
+    workers: int = 1,
+    pdf: bool = True,
+) -> dict[str, Path]:
+    """Generate monthly statement PDFs for several firms in one conversion batch.
+
+    All templates are filled first, then converted together, split across
+    *workers* converter instances.  Returns {firm_name: pdf_path}.
+
+    With ``pdf=False`` conversion is skipped entirely and the filled .docx
+    files are kept; returns {firm_name: docx_path}.
+    """
+    if config is None:
+        config = load_config()
+
+    # Each .docx is written on a background thread while the next firm renders;
+    # a single statement has nothing to overlap and is saved directly.
+    writes = _background_writes() if len(firm_names) > 1 else contextlib.nullcontext()
+    with writes as defer_write:
+        rendered = {
+            name: render_monthly_statement(name, year, month, config, defer_write)
+            for name in firm_names
+        }
+    if not pdf:
+        return {name: docx_out for name, (docx_out, _) in rendered.items()}
 
-    # Convert to PDF
-    pdf_out.parent.mkdir(parents=True, exist_ok=True)
-    convert(str(docx_out), str(pdf_out))
+    convert_many(list(rendered.values()), workers=workers)
 
     # Clean up intermediate .docx (don't remove month folder)
-    if not keep_docx and docx_out.exists():
-        docx_out.unlink()
+    if not keep_docx:
+        for docx_out, _ in rendered.values():
+            if docx_out.exists():
+                docx_out.unlink()
 
-    return pdf_out
+    return {name: pdf_out for name, (_, pdf_out) in rendered.items()}
@@ -8,41 +8,37 @@ import csv
 from datetime import date, datetime
 from pathlib import Path
 
-from openpyxl import load_workbook
-
-from src.dataset import dataset_path, get_data_root, load_dataset, _is_v2_format
+from src.dataset import (
+    dataset_path,
+    get_data_root,
+    invalidate_dataset_cache,
+    _is_v2_format,
+    _merge_case_appearance,
+    _to_date,
+)
 
 
 # ── Lookup by invoice number ─────────────────────────────────────────
 
-def find_by_invoice_number(
-    firm_name: str,
-    invoice_number: str,
-) -> dict | None:
-    """Find a case row by its invoice_number. Returns the dict or None."""
-    rows = load_dataset(firm_name)
-    target = invoice_number.strip()
-    for row in rows:
-        if str(row.get("invoice_number") or "").strip() == target:
-            return row
-    return None
-
-
-def _match_invoice_row(ws, headers: list[str], invoice_number: str) -> int | None:
-    """Return the Excel row number matching the invoice_number, or None."""
-    inv_col = headers.index("invoice_number")
-    target = invoice_number.strip()
+def _invoice_row_numbers(ws, headers: list[str]) -> dict[str, int]:
+    """Return {invoice_number: Excel row number} (first occurrence wins)."""
+    inv_col = headers.index("invoice_number") + 1
 
-    for row_num, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
-        val = str(row[inv_col] or "").strip()
-        if val == target:
-            return row_num
-    return None
+    # Only materialize the invoice_number column, not whole rows
+    column = ws.iter_rows(
+        min_row=2, min_col=inv_col, max_col=inv_col, values_only=True
+    )
+    index: dict[str, int] = {}
+    for row_num, (val,) in enumerate(column, start=2):
+        if val is not None:
+            index.setdefault(str(val).strip(), row_num)
+    return index
 
 
 # ── Update payment ───────────────────────────────────────────────────
 
 VALID_STATUSES = {"Paid", "Unpaid", "Partial"}
+VALID_STATUSES_SORTED: tuple[str, ...] = tuple(sorted(VALID_STATUSES))
 
 
 def mark_payment(
@@ -55,9 +51,32 @@ def mark_payment(
     """Update paid_status (and optionally payment_date, notes) for a case.
 
     Handles both v1 ('cases' sheet) and v2 ('appearances' sheet) formats.
-    Returns the updated case dict.
+    Returns the updated case dict, with charge_amount as a float and a
+    preformatted ``charge_amount_str`` (e.g. "1,250.00").
     Raises ValueError if invoice not found or invalid status.
     """
+    return mark_payments(
+        firm_name, [invoice_number], status, payment_date, notes
+    )[0]
+
+
+def mark_payments(
+    firm_name: str,
+    invoice_numbers: list[str],
+    status: str,
+    payment_date: date | str | None = None,
+    notes: str | None = None,
+) -> list[dict]:
+    """Apply the same payment update to several invoices of one firm.
+
+    The workbook is loaded and saved once and the audit log opened once,
+    however many invoices are updated.  Nothing is written unless every
+    invoice is found, and invoices whose values would not change are
+    neither rewritten nor logged.  Returns the updated case dicts in input order
+    (see ``mark_payment``).
+    """
+    from openpyxl import load_workbook
+
     from src.file_lock import FirmFileLock
 
     if status not in VALID_STATUSES:
@@ -67,6 +86,9 @@ def mark_payment(
     if not path.exists():
         raise FileNotFoundError(f"Dataset not found: {path}")
 
+    if isinstance(payment_date, str):
+        payment_date = datetime.strptime(payment_date, "%Y-%m-%d").date()
+
     with FirmFileLock(firm_name):
         wb = load_workbook(path)
 
@@ -80,45 +102,108 @@ def mark_payment(
 
         headers = [cell.value for cell in ws[1]]
 
-        row_num = _match_invoice_row(ws, headers, invoice_number)
-        if row_num is None:
+        row_numbers = _invoice_row_numbers(ws, headers)
+        missing = [inv for inv in invoice_numbers if inv.strip() not in row_numbers]
+        if missing:
             wb.close()
-            raise ValueError(
-                f"Invoice '{invoice_number}' not found in {firm_name}'s dataset."
-            )
+            label = "Invoice" if len(missing) == 1 else "Invoices"
+            names = ", ".join(f"'{inv}'" for inv in missing)
+            raise ValueError(f"{label} {names} not found in {firm_name}'s dataset.")
 
-        # Read current row for audit log
-        row_values = [ws.cell(row=row_num, column=c + 1).value for c in range(len(headers))]
-        old_row = dict(zip(headers, row_values))
-
-        # Update paid_status
         ps_col = headers.index("paid_status") + 1
-        ws.cell(row=row_num, column=ps_col, value=status)
-
-        # Update payment_date
         pd_col = headers.index("payment_date") + 1
-        if payment_date is not None:
-            if isinstance(payment_date, str):
-                payment_date = datetime.strptime(payment_date, "%Y-%m-%d").date()
-            ws.cell(row=row_num, column=pd_col, value=payment_date)
-        elif status == "Paid" and old_row.get("payment_date") is None:
-            # Auto-set payment_date to today if marking Paid and no date provided
-            ws.cell(row=row_num, column=pd_col, value=date.today())
-
-        # Update notes if provided
-        if notes is not None:
-            nc = headers.index(notes_col_name) + 1
-            ws.cell(row=row_num, column=nc, value=notes)
+        nc = headers.index(notes_col_name) + 1
+        case_rows = _case_rows_by_id(wb)
+
+        audit_entries = []
+        updated_rows = []
+        for invoice_number in invoice_numbers:
+            row_num = row_numbers[invoice_number.strip()]
+
+            # Read current row for audit log
+            row_values = [ws.cell(row=row_num, column=c + 1).value for c in range(len(headers))]
+            old_row = dict(zip(headers, row_values))
+
+            new_date = payment_date
+            if new_date is None and status == "Paid" and old_row.get("payment_date") is None:
+                # Auto-set payment_date to today if marking Paid and no date provided
+                new_date = date.today()
+
+            changed = (
+                old_row.get("paid_status") != status
+                or (new_date is not None and _to_date(old_row.get("payment_date")) != new_date)
+                or (notes is not None and old_row.get(notes_col_name) != notes)
+            )
+            if changed:
+                ws.cell(row=row_num, column=ps_col, value=status)
+                if new_date is not None:
+                    ws.cell(row=row_num, column=pd_col, value=new_date)
+                if notes is not None:
+                    ws.cell(row=row_num, column=nc, value=notes)
+                audit_entries.append((invoice_number, old_row))
+
+            # Build the returned dict from the open workbook instead of re-reading it
+            row_values = [ws.cell(row=row_num, column=c + 1).value for c in range(len(headers))]
+            updated_rows.append(
+                _with_amount_str(_updated_row(dict(zip(headers, row_values)), case_rows))
+            )
+
+        # Re-applying the current values is a no-op: skip the save and log
+        if not audit_entries:
+            wb.close()
+            return updated_rows
 
         wb.save(path)
         wb.close()
+        invalidate_dataset_cache(path)
+
+        _write_audit_log(firm_name, audit_entries, status, payment_date)
 
-        # Write audit log
-        # For audit, map back to case_caption from the merged view
-        _write_audit_log(firm_name, invoice_number, old_row, status, payment_date)
+    return updated_rows
 
-    # Re-read to return clean merged dict
-    return find_by_invoice_number(firm_name, invoice_number) or {}
+
+def _case_rows_by_id(wb) -> dict[str, dict] | None:
+    """Return {case_id: case row} for a v2 workbook, or None for v1."""
+    if not _is_v2_format(wb):
+        return None
+
+    ws_cases = wb["cases"]
+    case_headers = [cell.value for cell in ws_cases[1]]
+    cases: dict[str, dict] = {}
+    for values in ws_cases.iter_rows(min_row=2, values_only=True):
+        case = dict(zip(case_headers, values))
+        cases.setdefault(str(case.get("case_id")), case)
+    return cases
+
+
+def _updated_row(row: dict, case_rows: dict[str, dict] | None) -> dict:
+    """Return *row* as load_dataset() would after the workbook is saved.
+
+    v2 appearance rows are merged with their case from *case_rows*; dates
+    read back from the file as datetimes, so written dates are normalized
+    the same way.
+    """
+    pd_val = row.get("payment_date")
+    if isinstance(pd_val, date) and not isinstance(pd_val, datetime):
+        row["payment_date"] = datetime.combine(pd_val, datetime.min.time())
+
+    if case_rows is None:
+        return row
+
+    case_dict = case_rows.get(str(row.get("case_id") or ""), {})
+    return _merge_case_appearance(case_dict, row)
+
+
+def _with_amount_str(row: dict) -> dict:
+    """Normalize charge_amount to float and add its display string."""
+    try:
+        amt = float(row.get("charge_amount") or 0)
+    except (TypeError, ValueError):
+        amt = 0.0
+    if row.get("charge_amount") is not None:
+        row["charge_amount"] = amt
+    row["charge_amount_str"] = f"{amt:,.2f}"
+    return row
 
 
 # ── Audit log ────────────────────────────────────────────────────────
@@ -129,19 +214,17 @@ def _audit_log_path(firm_name: str) -> Path:
 
 def _write_audit_log(
     firm_name: str,
-    invoice_number: str,
-    old_row: dict,
+    entries: list[tuple[str, dict]],
     new_status: str,
     payment_date: date | str | None,
 ) -> None:
-    """Append a line to the firm's payment audit log."""
+    """Append one line per (invoice_number, old_row) to the firm's payment audit log."""
     log_path = _audit_log_path(firm_name)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
     file_exists = log_path.exists()
-
-    # old_row may come from v2 appearances sheet (no case_caption) or v1 (has it)
-    caption = old_row.get("case_caption") or old_row.get("caption", "")
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    date_str = str(payment_date) if payment_date else ""
 
     with open(log_path, "a", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
@@ -150,11 +233,15 @@ def _write_audit_log(
                 "timestamp", "invoice_number", "case_caption",
                 "old_status", "new_status", "payment_date",
             ])
-        writer.writerow([
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            invoice_number,
-            caption,
-            old_row.get("paid_status", ""),
-            new_status,
-            str(payment_date) if payment_date else "",
-        ])
+        writer.writerows(
+            [
+                timestamp,
+                invoice_number,
+                # old_row may come from v2 appearances sheet (no case_caption) or v1 (has it)
+                old_row.get("case_caption") or old_row.get("caption", ""),
+                old_row.get("paid_status", ""),
+                new_status,
+                date_str,
+            ]
+            for invoice_number, old_row in entries
+        )
@@ -0,0 +1,201 @@
+"""Batch .docx → .pdf conversion.
+
+On Windows every file in a batch is converted inside a single Word COM
+session, so Word starts once per batch instead of once per document.
+Wrap a larger unit of work in ``word_session()`` to share one Word
+instance across several ``convert_many`` calls.  On Linux, where docx2pdf
+has no Word to drive, each batch is one ``soffice --convert-to pdf``
+invocation.  On macOS each file goes through docx2pdf (Word), as before.
+
+``convert_many(..., workers=N)`` splits a batch across N threads, each
+driving its own Word process.
+"""
+
+import contextlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+WD_FORMAT_PDF = 17  # WdSaveFormat.wdFormatPDF
+WD_ALERTS_NONE = 0  # WdAlertLevel.wdAlertsNone
+
+# Upper bound for parallel converters in multi-firm batches — each one is
+# a full Word process.
+MAX_PARALLEL_CONVERTERS = 4
+
+
+class ConversionError(RuntimeError):
+    """A PDF converter failed or did not produce its output."""
+
+
+# Per-thread Word session state — COM objects are bound to their apartment.
+_local = threading.local()
+
+
+class _WordSession:
+    """Lazily started Word.Application, quit when the outermost session exits."""
+
+    def __init__(self):
+        self.app = None
+
+    def get_app(self):
+        if self.app is None:
+            import win32com.client
+
+            # DispatchEx always starts a private Word process, so sessions in
+            # other threads never share (or Quit) each other's instance.
+            app = win32com.client.DispatchEx("Word.Application")
+            # Headless: a modal dialog would stall the whole batch
+            app.Visible = False
+            app.DisplayAlerts = WD_ALERTS_NONE
+            self.app = app
+        return self.app
+
+    def close(self) -> None:
+        if self.app is not None:
+            try:
+                self.app.Quit()
+            finally:
+                self.app = None
+
+
+@contextlib.contextmanager
+def word_session():
+    """Share one Word instance across all conversions inside the block.
+
+    Word is only started if something is actually converted.  Nested
+    sessions reuse the outer one.  No-op on non-Windows platforms.
+    """
+    if sys.platform != "win32" or getattr(_local, "session", None) is not None:
+        yield
+        return
+
+    import pythoncom
+
+    pythoncom.CoInitialize()
+    _local.session = _WordSession()
+    try:
+        yield
+    finally:
+        try:
+            _local.session.close()
+        finally:
+            _local.session = None
+            pythoncom.CoUninitialize()
+
+
+def _convert_with_word(pairs: list[tuple[Path, Path]]) -> None:
+    """Convert (docx, pdf) pairs using the current thread's Word session."""
+    word = _local.session.get_app()
+    for docx_path, pdf_path in pairs:
+        doc = word.Documents.Open(
+            str(Path(docx_path).resolve()),
+            ConfirmConversions=False, ReadOnly=True, AddToRecentFiles=False,
+        )
+        try:
+            doc.SaveAs(str(Path(pdf_path).resolve()), FileFormat=WD_FORMAT_PDF)
+        finally:
+            doc.Close(0)
+
+
+def _find_soffice() -> str | None:
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def _convert_with_soffice(soffice: str, pairs: list[tuple[Path, Path]]) -> None:
+    """Convert (docx, pdf) pairs with one LibreOffice process per output folder.
+
+    A throwaway profile keeps parallel calls (and a desktop LibreOffice the
+    user may have open) from fighting over the same profile lock.  soffice
+    names each output ``<outdir>/<docx stem>.pdf``, so .docx files sharing a
+    stem go to separate calls.
+    """
+    # outdir -> calls, each a list of pairs with distinct .docx stems
+    by_dir: dict[Path, list[list[tuple[Path, Path]]]] = {}
+    for docx_path, pdf_path in pairs:
+        docx_path, pdf_path = Path(docx_path).resolve(), Path(pdf_path).resolve()
+        calls = by_dir.setdefault(pdf_path.parent, [])
+        for group in calls:
+            if all(d.stem != docx_path.stem for d, _ in group):
+                break
+        else:
+            group = []
+            calls.append(group)
+        group.append((docx_path, pdf_path))
+
+    groups = [(outdir, group) for outdir, calls in by_dir.items() for group in calls]
+    with tempfile.TemporaryDirectory(prefix="lo-profile-") as profile:
+        for outdir, group in groups:
+            # soffice exits 0 even when a document fails to load, so stale
+            # PDFs from an earlier run must not be mistaken for its output
+            for docx_path, pdf_path in group:
+                (outdir / f"{docx_path.stem}.pdf").unlink(missing_ok=True)
+                pdf_path.unlink(missing_ok=True)
+            try:
+                subprocess.run(
+                    [
+                        soffice,
+                        f"-env:UserInstallation={Path(profile).as_uri()}",
+                        "--headless", "--convert-to", "pdf",
+                        "--outdir", str(outdir),
+                        *(str(d) for d, _ in group),
+                    ],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+            except subprocess.CalledProcessError as exc:
+                detail = exc.stderr.decode(errors="replace").strip() if exc.stderr else ""
+                raise ConversionError(
+                    f"LibreOffice PDF conversion failed (exit {exc.returncode})"
+                    + (f": {detail}" if detail else "")
+                ) from exc
+            # soffice names the output after the .docx stem
+            for docx_path, pdf_path in group:
+                produced = outdir / f"{docx_path.stem}.pdf"
+                if not produced.exists():
+                    raise ConversionError(f"LibreOffice did not produce {produced}")
+                if produced != pdf_path:
+                    os.replace(produced, pdf_path)
+
+
+def _convert_chunk(pairs: list[tuple[Path, Path]]) -> None:
+    if sys.platform == "win32":
+        with word_session():
+            _convert_with_word(pairs)
+    elif sys.platform.startswith("linux") and (soffice := _find_soffice()):
+        _convert_with_soffice(soffice, pairs)
+    else:
+        from docx2pdf import convert
+
+        for docx_path, pdf_path in pairs:
+            convert(str(docx_path), str(pdf_path))
+
+
+def convert_many(pairs: list[tuple[Path, Path]], workers: int = 1) -> list[Path]:
+    """Convert each (docx_path, pdf_path) pair. Returns the PDF paths in order.
+
+    With *workers* > 1 the batch is dealt round-robin across that many
+    threads, each with its own converter instance.
+    """
+    if not pairs:
+        return []
+
+    for _, pdf_path in pairs:
+        Path(pdf_path).parent.mkdir(parents=True, exist_ok=True)
+
+    workers = max(1, min(workers, len(pairs)))
+    if workers == 1:
+        _convert_chunk(pairs)
+    else:
+        chunks = [pairs[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() re-raises the first worker exception
+            list(pool.map(_convert_chunk, chunks))
+
+    return [Path(pdf_path) for _, pdf_path in pairs]
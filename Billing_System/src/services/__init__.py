@@ -8,9 +8,10 @@ structured data without coupling to module internals.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import date
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServiceResult:
     """Standardised return type for all service functions.
 
@@ -23,3 +24,40 @@ class ServiceResult:
     success: bool
     message: str
     data: dict | None = field(default=None)
+
+
+def parse_iso_date(value: str | None) -> date | None:
+    """Parse a strict YYYY-MM-DD string. Returns None if it isn't a valid date."""
+    from src.dataset import _parse_ymd
+
+    return _parse_ymd(value or "", strict=True)
+
+
+def resolve_config(config: dict | None) -> dict:
+    """Return *config*, or the (cached) on-disk config when None."""
+    if config is None:
+        from src.config import load_config
+
+        return load_config()
+    return config
+
+
+def validate_firm(firm: str, config: dict) -> str | None:
+    """Return an error message if *firm* is not configured, else None."""
+    return validate_firms([firm], config)
+
+
+def validate_firms(firms: list[str], config: dict) -> str | None:
+    """Return an error message for the first unconfigured firm, else None.
+
+    The configured-name set is resolved once for the whole list.
+    """
+    from src.config import firm_name_set
+
+    known = firm_name_set(config)
+    for firm in firms:
+        if firm not in known:
+            from src.dataset import all_firm_names
+
+            return f"Firm '{firm}' not found. Available: {all_firm_names(config)}"
+    return None
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
 
-from src.config import CONFIG_PATH, load_config
+from src.config import CONFIG_PATH, index_firms
 from src.audit_log import append_audit
 from src.dataset import (
     CASE_COLUMNS,
@@ -13,33 +16,32 @@ from src.dataset import (
     COLUMNS,
     VALID_CASE_STATUSES,
     all_firm_names,
+    create_all_workbooks,
     create_workbook,
     dataset_path,
     find_row_by_key,
-    load_dataset,
     upsert_row,
     validate_dataset,
+    write_row,
 )
 from src.invoice_number import assign_invoice_numbers
-from src.legacy_import import import_legacy_invoice
-from src.services import ServiceResult
+from src.services import ServiceResult, resolve_config, validate_firm
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
-def _resolve_config(config: dict | None) -> dict:
-    if config is None:
-        return load_config()
-    return config
+def _map_firms(fn, firms: list[str], *args) -> list:
+    """Run ``fn(firm, *args)`` for each firm, in a process pool when there are several.
 
-
-def _validate_firm(firm: str, config: dict) -> str | None:
-    """Return an error message if *firm* is not in config, else None."""
-    known = all_firm_names(config)
-    if firm not in known:
-        return f"Firm '{firm}' not found. Available: {known}"
-    return None
+    Per-firm workbooks are independent, so firms parse in parallel.
+    Results come back in *firms* order.
+    """
+    if len(firms) <= 1:
+        return [fn(name, *args) for name in firms]
+    workers = min(os.cpu_count() or 1, len(firms))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, firms, *(repeat(a) for a in args)))
 
 
 # ── Public API ───────────────────────────────────────────────────────
@@ -54,16 +56,17 @@ def init_datasets(
 
     Returns created file paths in ``data["created"]``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
     firms = [firm] if firm else all_firm_names(config)
 
-    created: list[str] = []
-    for name in firms:
-        try:
-            path = create_workbook(name, overwrite=force)
-            created.append(str(path))
-        except FileExistsError as exc:
-            return ServiceResult(success=False, message=str(exc))
+    try:
+        if firm:
+            paths = [create_workbook(firm, overwrite=force)]
+        else:
+            paths = create_all_workbooks(config, overwrite=force)
+    except FileExistsError as exc:
+        return ServiceResult(success=False, message=str(exc))
+    created = [str(p) for p in paths]
 
     lines = [f"Created: {p}" for p in created]
     lines.append(f"\n  Sheets: cases ({len(CASE_COLUMNS)} cols), appearances ({len(APPEARANCE_COLUMNS)} cols)")
@@ -84,29 +87,26 @@ def validate_datasets(
 
     Returns per-firm errors and row counts in ``data["firms"]``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
     firms = [firm] if firm else all_firm_names(config)
 
     results: dict[str, dict] = {}
     total_errors = 0
     lines: list[str] = []
 
-    for name in firms:
+    for name, (errors, row_count) in zip(firms, _map_firms(validate_dataset, firms)):
         path = dataset_path(name)
         lines.append(f"--- {name} ---")
         lines.append(f"  File: {path}")
 
-        errors = validate_dataset(name)
         if errors:
             lines.append(f"  FAILED - {len(errors)} error(s):")
-            for err in errors:
-                lines.append(f"    - {err}")
+            lines.extend(f"    - {err}" for err in errors)
             total_errors += len(errors)
             results[name] = {"errors": errors, "row_count": None}
         else:
-            rows = load_dataset(name)
-            lines.append(f"  OK - {len(rows)} data row(s)")
-            results[name] = {"errors": [], "row_count": len(rows)}
+            lines.append(f"  OK - {row_count} data row(s)")
+            results[name] = {"errors": [], "row_count": row_count}
         lines.append("")
 
     if total_errors:
@@ -141,24 +141,27 @@ def add_or_update_case(
 
     Returns the action taken and the row data in ``data``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
+    # Skip None values so updates don't blank out existing fields
     row_data = {
-        "appearance_date": appearance_date,
-        "index_number": index_number,
-        "case_caption": case_caption,
-        "charge_amount": charge_amount,
-        "court": court,
-        "outcome": outcome,
-        "case_status": case_status,
-        "notes": notes,
+        k: v
+        for k, v in (
+            ("appearance_date", appearance_date),
+            ("index_number", index_number),
+            ("case_caption", case_caption),
+            ("charge_amount", charge_amount),
+            ("court", court),
+            ("outcome", outcome),
+            ("case_status", case_status),
+            ("notes", notes),
+        )
+        if v is not None
     }
-    # Remove None values so updates don't blank out existing fields
-    row_data = {k: v for k, v in row_data.items() if v is not None}
 
     try:
         action = upsert_row(firm, row_data)
@@ -194,23 +197,23 @@ def assign_invoices(
 
     Returns assigned invoice numbers per firm in ``data["assigned"]``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
     firms = [firm] if firm else all_firm_names(config)
 
     all_assigned: dict[str, list[str]] = {}
     lines: list[str] = []
 
-    for name in firms:
+    try:
+        per_firm = _map_firms(assign_invoice_numbers, firms, config)
+    except FileNotFoundError as exc:
+        return ServiceResult(success=False, message=str(exc))
+
+    for name, assigned in zip(firms, per_firm):
         lines.append(f"--- {name} ---")
-        try:
-            assigned = assign_invoice_numbers(name, config)
-        except FileNotFoundError as exc:
-            return ServiceResult(success=False, message=str(exc))
 
         all_assigned[name] = assigned
         if assigned:
-            for inv in assigned:
-                lines.append(f"  Assigned: {inv}")
+            lines.extend(f"  Assigned: {inv}" for inv in assigned)
             lines.append(f"  Total new: {len(assigned)}")
         else:
             lines.append("  No cases need invoice numbers.")
@@ -232,12 +235,14 @@ def import_legacy(
 
     Returns import results in ``data``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
+    from src.legacy_import import import_legacy_invoice
+
     try:
         results = import_legacy_invoice(firm, file_path)
     except (FileNotFoundError, ValueError) as exc:
@@ -250,29 +255,27 @@ def import_legacy(
             data={"results": [], "inserted": 0, "updated": 0},
         )
 
+    lines = []
     inserted = 0
-    updated = 0
-    lines: list[str] = []
-
     for action, case in results:
-        label = "NEW" if action == "inserted" else "UPD"
+        is_new = action == "inserted"
+        inserted += is_new
         lines.append(
-            f"  [{label}] {case['appearance_date']} | "
+            f"  [{'NEW' if is_new else 'UPD'}] {case['appearance_date']} | "
             f"{case['index_number']} | {case['case_caption']} | "
             f"${case['charge_amount']:.2f}"
         )
-        if action == "inserted":
-            inserted += 1
-        else:
-            updated += 1
-
-    lines.append(f"\nImported {len(results)} case(s): {inserted} new, {updated} updated.")
+    updated = len(results) - inserted
+    body = "\n".join(lines)
 
     return ServiceResult(
         success=True,
-        message="\n".join(lines),
+        message=(
+            f"{body}\n\nImported {len(results)} case(s): "
+            f"{inserted} new, {updated} updated."
+        ),
         data={
-            "results": [(a, c) for a, c in results],
+            "results": results,
             "inserted": inserted,
             "updated": updated,
         },
@@ -289,6 +292,10 @@ EDITABLE_FIELDS = {
     "notes":         "EDIT_NOTES",
 }
 
+# Invariant parts of edit_case_field's error messages
+_ALLOWED_FIELDS = ", ".join(sorted(EDITABLE_FIELDS))
+_SORTED_CASE_STATUSES = sorted(VALID_CASE_STATUSES)
+
 
 def edit_case_field(
     firm: str,
@@ -301,19 +308,19 @@ def edit_case_field(
 ) -> ServiceResult:
     """Edit a single field on an existing case, with audit logging.
 
-    Returns old and new values in ``data``.
+    Wrap several calls in ``dataset.batch_writes()`` to save the workbook
+    once instead of per edit.  Returns old and new values in ``data``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
     if field_name not in EDITABLE_FIELDS:
-        allowed = ", ".join(sorted(EDITABLE_FIELDS))
         return ServiceResult(
             success=False,
-            message=f"Field '{field_name}' is not editable. Allowed: {allowed}",
+            message=f"Field '{field_name}' is not editable. Allowed: {_ALLOWED_FIELDS}",
         )
 
     row = find_row_by_key(firm, index_number, appearance_date)
@@ -356,12 +363,12 @@ def edit_case_field(
                 success=False,
                 message=(
                     f"Invalid case_status '{new_value}'. "
-                    f"Must be one of: {sorted(VALID_CASE_STATUSES)}"
+                    f"Must be one of: {_SORTED_CASE_STATUSES}"
                 ),
             )
 
-    # Write update
-    upsert_row(firm, {
+    # Write update (deferred when inside dataset.batch_writes())
+    write_row(firm, {
         "index_number": index_number,
         "appearance_date": appearance_date,
         field_name: coerced_value,
@@ -415,7 +422,7 @@ def extract_firms(
     """
     from src.firm_extractor import scan_all_firms
 
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
     inv_path = Path(invoices_dir)
     if not inv_path.is_dir():
@@ -462,6 +469,18 @@ def extract_firms(
 # ── Phase 19: bulk import ────────────────────────────────────────────
 
 
+def _unique_initials(initials: str, folder_name: str, used: set[str]) -> str:
+    """Extend clashing *initials* with a letter from the folder name, then 1-99.
+
+    Returns the first unused candidate (or *initials* unchanged if none is free).
+    """
+    candidates = chain(
+        (initials + c.upper() for c in folder_name if c.isalpha()),
+        (f"{initials}{i}" for i in range(1, 100)),
+    )
+    return next((c for c in candidates if c not in used), initials)
+
+
 def bulk_import(
     firms_json: str,
     invoices_dir: str,
@@ -477,7 +496,7 @@ def bulk_import(
     Returns:
         ServiceResult with summary of firms added and datasets created.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
     # 1. Load extracted firms
     firms_path = Path(firms_json)
@@ -521,21 +540,7 @@ def bulk_import(
             initials = "".join(w[0] for w in words if w).upper()[:3]
 
         if initials in used_initials:
-            # Append letters from folder name until unique
-            alpha_chars = [c.upper() for c in firm["folder_name"] if c.isalpha()]
-            resolved = False
-            for ch in alpha_chars:
-                candidate = initials + ch
-                if candidate not in used_initials:
-                    initials = candidate
-                    resolved = True
-                    break
-            if not resolved:
-                for i in range(1, 100):
-                    candidate = initials + str(i)
-                    if candidate not in used_initials:
-                        initials = candidate
-                        break
+            initials = _unique_initials(initials, firm["folder_name"], used_initials)
 
         firm["_resolved_initials"] = initials
         used_initials.add(initials)
@@ -553,8 +558,12 @@ def bulk_import(
             "cc_emails": firm.get("cc_emails", []),
         })
 
+    index_firms(config)
+
+    # Derived "_" keys are not part of config.json
+    on_disk = {k: v for k, v in config.items() if not k.startswith("_")}
     with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+        json.dump(on_disk, f, indent=2, ensure_ascii=False)
 
     # 6. Create blank datasets for new firms
     datasets_created = 0
@@ -598,10 +607,10 @@ def migrate_v2(
     """
     from src.migrate_v2 import migrate_firm, migrate_all_firms
 
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
     if firm:
-        err = _validate_firm(firm, config)
+        err = validate_firm(firm, config)
         if err:
             return ServiceResult(success=False, message=err)
 
@@ -2,31 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import date as _date
+from src.pdf_convert import ConversionError
+from src.services import (
+    ServiceResult,
+    parse_iso_date,
+    resolve_config,
+    validate_firm,
+    validate_firms,
+)
 
-from src.config import load_config
-from src.dataset import all_firm_names
-from src.doc_generator import generate_invoice
-from src.ledger_export import export_ledger as _export_ledger
-from src.monthly_statement import generate_monthly_statement
-from src.services import ServiceResult
-from src.weekly_statement import generate_weekly_statement
 
-
-# ── Helpers ──────────────────────────────────────────────────────────
-
-
-def _resolve_config(config: dict | None) -> dict:
-    if config is None:
-        return load_config()
-    return config
-
-
-def _validate_firm(firm: str, config: dict) -> str | None:
-    known = all_firm_names(config)
-    if firm not in known:
-        return f"Firm '{firm}' not found. Available: {known}"
-    return None
+def _path_key(pdf: bool) -> str:
+    """``data`` key for a generated statement: "pdf_path" or "docx_path"."""
+    return "pdf_path" if pdf else "docx_path"
 
 
 # ── Public API ───────────────────────────────────────────────────────
@@ -43,17 +31,19 @@ def generate_daily(
 
     Returns the PDF path in ``data["pdf_path"]``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
+    from src.doc_generator import generate_invoice
+
     try:
         pdf_path = generate_invoice(
             firm, index_number, appearance_date, config, keep_docx=keep_docx
         )
-    except (ValueError, FileNotFoundError) as exc:
+    except (ValueError, FileNotFoundError, ConversionError) as exc:
         return ServiceResult(success=False, message=str(exc))
 
     return ServiceResult(
@@ -68,29 +58,82 @@ def generate_weekly(
     week_of: str,
     keep_docx: bool = False,
     config: dict | None = None,
+    pdf: bool = True,
 ) -> ServiceResult:
     """Generate a weekly statement of account for a firm.
 
     *week_of* is a YYYY-MM-DD string; the Mon-Fri range is computed.
-    Returns the PDF path and date range in ``data``.
+    Returns the PDF path and date range in ``data``.  With ``pdf=False``
+    only the .docx is written and ``data["docx_path"]`` is set instead.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
+    ref = parse_iso_date(week_of)
+    if ref is None:
+        return ServiceResult(
+            success=False,
+            message=f"Invalid date: {week_of}. Use YYYY-MM-DD.",
+        )
+
+    from src.weekly_statement import generate_weekly_statement
+
     try:
-        ref = _date.fromisoformat(week_of)
-    except ValueError:
+        out_path = generate_weekly_statement(
+            firm, ref, config, keep_docx=keep_docx, pdf=pdf
+        )
+    except (FileNotFoundError, ConversionError) as exc:
+        return ServiceResult(success=False, message=str(exc))
+
+    from src.dataset import week_range
+    monday, friday = week_range(ref)
+
+    return ServiceResult(
+        success=True,
+        message=f"Weekly statement generated: {out_path}",
+        data={_path_key(pdf): out_path, "monday": monday, "friday": friday},
+    )
+
+
+def generate_weekly_batch(
+    firms: list[str],
+    week_of: str,
+    keep_docx: bool = False,
+    config: dict | None = None,
+    pdf: bool = True,
+) -> ServiceResult:
+    """Generate weekly statements for several firms with one PDF conversion batch.
+
+    Conversion runs on up to ``MAX_PARALLEL_CONVERTERS`` Word instances.
+
+    Returns PDF paths per firm in ``data["pdf_paths"]`` and the date range
+    (``data["docx_paths"]`` with ``pdf=False``, which skips conversion).
+    """
+    config = resolve_config(config)
+
+    err = validate_firms(firms, config)
+    if err:
+        return ServiceResult(success=False, message=err)
+
+    ref = parse_iso_date(week_of)
+    if ref is None:
         return ServiceResult(
             success=False,
             message=f"Invalid date: {week_of}. Use YYYY-MM-DD.",
         )
 
+    from src.pdf_convert import MAX_PARALLEL_CONVERTERS
+    from src.weekly_statement import generate_weekly_statements
+
     try:
-        pdf_path = generate_weekly_statement(firm, ref, config, keep_docx=keep_docx)
-    except FileNotFoundError as exc:
+        out_paths = generate_weekly_statements(
+            firms, ref, config, keep_docx=keep_docx,
+            workers=min(len(firms), MAX_PARALLEL_CONVERTERS), pdf=pdf,
+        )
+    except (FileNotFoundError, ConversionError) as exc:
         return ServiceResult(success=False, message=str(exc))
 
     from src.dataset import week_range
@@ -98,8 +141,10 @@ def generate_weekly(
 
     return ServiceResult(
         success=True,
-        message=f"Weekly statement generated: {pdf_path}",
-        data={"pdf_path": pdf_path, "monday": monday, "friday": friday},
+        message="\n".join(
+            f"Weekly statement generated: {p}" for p in out_paths.values()
+        ),
+        data={_path_key(pdf) + "s": out_paths, "monday": monday, "friday": friday},
     )
 
 
@@ -109,14 +154,16 @@ def generate_monthly(
     month: int,
     keep_docx: bool = False,
     config: dict | None = None,
+    pdf: bool = True,
 ) -> ServiceResult:
     """Generate a monthly statement of account for a firm.
 
-    Returns the PDF path in ``data["pdf_path"]``.
+    Returns the PDF path in ``data["pdf_path"]`` (``data["docx_path"]``
+    with ``pdf=False``, which skips conversion).
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
@@ -126,17 +173,66 @@ def generate_monthly(
             message=f"Invalid month: {month}. Must be 1-12.",
         )
 
+    from src.monthly_statement import generate_monthly_statement
+
     try:
-        pdf_path = generate_monthly_statement(
-            firm, year, month, config, keep_docx=keep_docx
+        out_path = generate_monthly_statement(
+            firm, year, month, config, keep_docx=keep_docx, pdf=pdf
         )
-    except FileNotFoundError as exc:
+    except (FileNotFoundError, ConversionError) as exc:
         return ServiceResult(success=False, message=str(exc))
 
     return ServiceResult(
         success=True,
-        message=f"Monthly statement generated: {pdf_path}",
-        data={"pdf_path": pdf_path},
+        message=f"Monthly statement generated: {out_path}",
+        data={_path_key(pdf): out_path},
+    )
+
+
+def generate_monthly_batch(
+    firms: list[str],
+    year: int,
+    month: int,
+    keep_docx: bool = False,
+    config: dict | None = None,
+    pdf: bool = True,
+) -> ServiceResult:
+    """Generate monthly statements for several firms with one PDF conversion batch.
+
+    Conversion runs on up to ``MAX_PARALLEL_CONVERTERS`` Word instances.
+
+    Returns PDF paths per firm in ``data["pdf_paths"]`` (``data["docx_paths"]``
+    with ``pdf=False``, which skips conversion).
+    """
+    config = resolve_config(config)
+
+    err = validate_firms(firms, config)
+    if err:
+        return ServiceResult(success=False, message=err)
+
+    if not (1 <= month <= 12):
+        return ServiceResult(
+            success=False,
+            message=f"Invalid month: {month}. Must be 1-12.",
+        )
+
+    from src.monthly_statement import generate_monthly_statements
+    from src.pdf_convert import MAX_PARALLEL_CONVERTERS
+
+    try:
+        out_paths = generate_monthly_statements(
+            firms, year, month, config, keep_docx=keep_docx,
+            workers=min(len(firms), MAX_PARALLEL_CONVERTERS), pdf=pdf,
+        )
+    except (FileNotFoundError, ConversionError) as exc:
+        return ServiceResult(success=False, message=str(exc))
+
+    return ServiceResult(
+        success=True,
+        message="\n".join(
+            f"Monthly statement generated: {p}" for p in out_paths.values()
+        ),
+        data={_path_key(pdf) + "s": out_paths},
     )
 
 
@@ -151,28 +247,29 @@ def export_ledger(
 
     Returns file paths in ``data``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
     as_of_date = None
     if as_of:
-        try:
-            as_of_date = _date.fromisoformat(as_of)
-        except ValueError:
+        as_of_date = parse_iso_date(as_of)
+        if as_of_date is None:
             return ServiceResult(
                 success=False,
                 message=f"Invalid date: {as_of}. Use YYYY-MM-DD.",
             )
 
+    from src.ledger_export import export_ledger as _export_ledger
+
     try:
         result = _export_ledger(
             firm, as_of=as_of_date, config=config,
             keep_docx=keep_docx, xlsx=xlsx,
         )
-    except FileNotFoundError as exc:
+    except (FileNotFoundError, ConversionError) as exc:
         return ServiceResult(success=False, message=str(exc))
 
     lines = [f"Ledger PDF: {result['pdf']}"]
@@ -2,37 +2,25 @@
 
 from __future__ import annotations
 
-import calendar
+import os
 from datetime import date as _date
 from pathlib import Path
 
-from src.config import get_firm, load_config
+from src.config import get_firm
 from src.dataset import (
-    all_firm_names,
     find_row_by_key,
     get_data_root,
+    load_index,
+    query_by_date_range,
+    row_key,
     week_range,
 )
-from src.email_draft import create_draft
-from src.services import ServiceResult
+from src.services import ServiceResult, parse_iso_date, resolve_config, validate_firm
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
-def _resolve_config(config: dict | None) -> dict:
-    if config is None:
-        return load_config()
-    return config
-
-
-def _validate_firm(firm: str, config: dict) -> str | None:
-    known = all_firm_names(config)
-    if firm not in known:
-        return f"Firm '{firm}' not found. Available: {known}"
-    return None
-
-
 def _parse_date(val) -> _date:
     """Coerce a value to a date object."""
     from datetime import datetime
@@ -43,24 +31,39 @@ def _parse_date(val) -> _date:
     return _date.fromisoformat(str(val).split(" ")[0])
 
 
+def _ordinal_suffix(n: int) -> str:
+    if 11 <= n % 100 <= 13:
+        return "th"
+    return ("th", "st", "nd", "rd")[n % 10] if n % 10 < 4 else "th"
+
+
+# Day-of-month ordinals, index 0 unused: "1st" .. "31st"
+_ORDINALS: tuple[str, ...] = tuple(f"{n}{_ordinal_suffix(n)}" for n in range(32))
+
+
 def _ordinal(n: int) -> str:
     """Return day with ordinal suffix (1st, 2nd, 3rd, etc.)."""
-    if 11 <= n % 100 <= 13:
-        return f"{n}th"
-    return f"{n}{('th','st','nd','rd')[min(n % 10, 4)] if n % 10 < 4 else 'th'}"
+    return _ORDINALS[n]
+
+
+# English month names, index 0 unused.  calendar.month_name follows the
+# process locale; these emails are always English.
+_MONTH_NAME: tuple[str, ...] = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
 
 
 def _format_date_long(d: _date) -> str:
     """Format date as 'February 20th, 2026'."""
-    return f"{calendar.month_name[d.month]} {_ordinal(d.day)}, {d.year}"
+    return f"{_MONTH_NAME[d.month]} {_ordinal(d.day)}, {d.year}"
 
 
 # ── Path resolution (mirrors doc generation output paths) ────────────
 
 
-def _daily_pdf_path(firm: str, case: dict) -> Path:
-    """Resolve the expected PDF path for a daily per-diem invoice."""
-    dt = _parse_date(case["appearance_date"])
+def _daily_pdf_path(firm: str, case: dict, dt: _date) -> Path:
+    """Resolve the expected PDF path for a daily per-diem invoice on *dt*."""
     date_prefix = dt.strftime("%m-%d-%Y")
     caption = str(case.get("case_caption") or "case")
     monday, _ = week_range(dt)
@@ -99,57 +102,96 @@ def _monthly_pdf_path(firm: str, year: int, month: int) -> Path:
 # ── Email body templates (HTML) ──────────────────────────────────────
 
 
-def _daily_body(firm: str, case: dict) -> str:
-    dt = _parse_date(case["appearance_date"])
-    caption = case.get("case_caption", "")
-    index = case.get("index_number", "")
-    inv = case.get("invoice_number", "")
-    amount = case.get("charge_amount", 0)
+_ROW = "<tr><td style='padding:2px 12px 2px 0;'><b>{label}:</b></td><td>{{{key}}}</td></tr>"
+
+_DAILY_TMPL = (
+    "<p>Dear Counsel,</p>"
+    "<p>Please find attached the per diem invoice for the following appearance:</p>"
+    "<table style='border-collapse:collapse; margin:10px 0;'>"
+    + _ROW.format(label="Date", key="date")
+    + _ROW.format(label="Case", key="caption")
+    + _ROW.format(label="Index #", key="index")
+    + _ROW.format(label="Invoice #", key="invoice")
+    + _ROW.format(label="Amount", key="amount")
+    + "</table>"
+    "<p>Thank you.</p>"
+    "<br>"
+)
+
+_STATEMENT_TMPL = (
+    "<p>Dear Counsel,</p>"
+    "<p>Please find attached the {kind} statement of account for "
+    "<b>{firm}</b> {period}.</p>"
+    "<p>This statement summarizes invoices previously sent. "
+    "No new charges are added.</p>"
+    "<p>Thank you.</p>"
+    "<br>"
+)
 
-    return (
-        f"<p>Dear Counsel,</p>"
-        f"<p>Please find attached the per diem invoice for the following appearance:</p>"
-        f"<table style='border-collapse:collapse; margin:10px 0;'>"
-        f"<tr><td style='padding:2px 12px 2px 0;'><b>Date:</b></td>"
-        f"<td>{_format_date_long(dt)}</td></tr>"
-        f"<tr><td style='padding:2px 12px 2px 0;'><b>Case:</b></td>"
-        f"<td>{caption}</td></tr>"
-        f"<tr><td style='padding:2px 12px 2px 0;'><b>Index #:</b></td>"
-        f"<td>{index}</td></tr>"
-        f"<tr><td style='padding:2px 12px 2px 0;'><b>Invoice #:</b></td>"
-        f"<td>{inv}</td></tr>"
-        f"<tr><td style='padding:2px 12px 2px 0;'><b>Amount:</b></td>"
-        f"<td>${float(amount):,.2f}</td></tr>"
-        f"</table>"
-        f"<p>Thank you.</p>"
-        f"<br>"
-    )
+
+def _daily_body(firm: str, case: dict, dt: _date) -> str:
+    return _DAILY_TMPL.format_map({
+        "date": _format_date_long(dt),
+        "caption": case.get("case_caption", ""),
+        "index": case.get("index_number", ""),
+        "invoice": case.get("invoice_number", ""),
+        "amount": f"${float(case.get('charge_amount', 0)):,.2f}",
+    })
 
 
 def _weekly_body(firm: str, monday: _date, friday: _date) -> str:
-    return (
-        f"<p>Dear Counsel,</p>"
-        f"<p>Please find attached the weekly statement of account for "
-        f"<b>{firm}</b> covering the period "
-        f"{_format_date_long(monday)} &ndash; {_format_date_long(friday)}.</p>"
-        f"<p>This statement summarizes invoices previously sent. "
-        f"No new charges are added.</p>"
-        f"<p>Thank you.</p>"
-        f"<br>"
-    )
+    return _STATEMENT_TMPL.format_map({
+        "kind": "weekly",
+        "firm": firm,
+        "period": (
+            f"covering the period "
+            f"{_format_date_long(monday)} &ndash; {_format_date_long(friday)}"
+        ),
+    })
 
 
 def _monthly_body(firm: str, year: int, month: int) -> str:
-    month_name = calendar.month_name[month]
-    return (
-        f"<p>Dear Counsel,</p>"
-        f"<p>Please find attached the monthly statement of account for "
-        f"<b>{firm}</b> for <b>{month_name} {year}</b>.</p>"
-        f"<p>This statement summarizes invoices previously sent. "
-        f"No new charges are added.</p>"
-        f"<p>Thank you.</p>"
-        f"<br>"
-    )
+    return _STATEMENT_TMPL.format_map({
+        "kind": "monthly",
+        "firm": firm,
+        "period": f"for <b>{_MONTH_NAME[month]} {year}</b>",
+    })
+
+
+def _listing_exists():
+    """Return an exists(path) check that lists each parent directory once.
+
+    For batches whose PDFs share a folder: one listdir instead of a stat
+    per file.
+    """
+    listings: dict[Path, frozenset[str]] = {}
+
+    def exists(path: Path) -> bool:
+        names = listings.get(path.parent)
+        if names is None:
+            try:
+                names = frozenset(map(os.path.normcase, os.listdir(path.parent)))
+            except OSError:
+                names = frozenset()
+            listings[path.parent] = names
+        return os.path.normcase(path.name) in names
+
+    return exists
+
+
+def _daily_draft(firm: str, case: dict, exists=Path.exists) -> tuple[str, str, Path] | str:
+    """Return (subject, body_html, pdf_path) for a case, or an error message."""
+    inv_num = case.get("invoice_number")
+    if not inv_num:
+        return "Case has no invoice number. Run 'assign-invoices' first."
+
+    dt = _parse_date(case["appearance_date"])
+    pdf = _daily_pdf_path(firm, case, dt)
+    if not exists(pdf):
+        return f"Invoice PDF not found: {pdf}\nRun 'generate-daily' first."
+
+    caption = case.get("case_caption", "")
+    return f"Per Diem Invoice {inv_num} - {caption}", _daily_body(firm, case, dt), pdf
 
 
 # ── Public API ───────────────────────────────────────────────────────
@@ -166,9 +208,9 @@ def draft_daily(
     The PDF must already exist (run ``generate-daily`` first).
     Returns draft metadata in ``data``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
@@ -179,19 +221,10 @@ def draft_daily(
             message=f"Case not found: index={index_number}, date={appearance_date} in firm '{firm}'.",
         )
 
-    inv_num = case.get("invoice_number")
-    if not inv_num:
-        return ServiceResult(
-            success=False,
-            message="Case has no invoice number. Run 'assign-invoices' first.",
-        )
-
-    pdf = _daily_pdf_path(firm, case)
-    if not pdf.exists():
-        return ServiceResult(
-            success=False,
-            message=f"Invoice PDF not found: {pdf}\nRun 'generate-daily' first.",
-        )
+    draft = _daily_draft(firm, case)
+    if isinstance(draft, str):
+        return ServiceResult(success=False, message=draft)
+    subject, body, pdf = draft
 
     firm_cfg = get_firm(firm, config)
     to = firm_cfg.get("billing_email", "")
@@ -204,9 +237,7 @@ def draft_daily(
     cc_list = firm_cfg.get("cc_emails", [])
     cc = "; ".join(cc_list) if cc_list else None
 
-    caption = case.get("case_caption", "")
-    subject = f"Per Diem Invoice {inv_num} - {caption}"
-    body = _daily_body(firm, case)
+    from src.email_draft import create_draft
 
     try:
         meta = create_draft(to=to, subject=subject, body_html=body, cc=cc, attachment_paths=[pdf])
@@ -220,6 +251,119 @@ def draft_daily(
     )
 
 
+def draft_daily_batch(
+    firm: str,
+    keys: list[tuple[str, str]],
+    config: dict | None = None,
+) -> ServiceResult:
+    """Create Outlook drafts for several daily invoices of one firm.
+
+    *keys* are (index_number, appearance_date) pairs.  The dataset is
+    loaded once and every draft goes through a single Outlook connection.
+    Nothing is drafted unless every case is ready (invoice number + PDF).
+    Returns the per-draft metadata list in ``data["drafts"]``.
+    """
+    config = resolve_config(config)
+
+    err = validate_firm(firm, config)
+    if err:
+        return ServiceResult(success=False, message=err)
+
+    firm_cfg = get_firm(firm, config)
+    to = firm_cfg.get("billing_email", "")
+    if not to:
+        return ServiceResult(
+            success=False,
+            message=f"No billing_email configured for firm '{firm}'. Update config.json.",
+        )
+
+    cc_list = firm_cfg.get("cc_emails", [])
+    cc = "; ".join(cc_list) if cc_list else None
+
+    cases = load_index(firm)
+    exists = _listing_exists()
+    drafts: list[tuple[str, str, Path]] = []
+    problems: list[str] = []
+    for index_number, appearance_date in keys:
+        case = cases.get(row_key(index_number, appearance_date))
+        if case is None:
+            problems.append(f"Case not found: index={index_number}, date={appearance_date}")
+            continue
+        draft = _daily_draft(firm, case, exists)
+        if isinstance(draft, str):
+            problems.append(f"{index_number} ({appearance_date}): {draft}")
+        else:
+            drafts.append(draft)
+
+    if problems:
+        return ServiceResult(
+            success=False,
+            message=f"No drafts created for '{firm}':\n" + "\n".join(f"  - {p}" for p in problems),
+        )
+
+    from src.email_draft import connect_outlook, create_draft
+
+    created: list[dict] = []
+    try:
+        outlook = connect_outlook()
+        for subject, body, pdf in drafts:
+            created.append(create_draft(
+                to=to, subject=subject, body_html=body, cc=cc,
+                attachment_paths=[pdf], outlook=outlook,
+            ))
+    except (OSError, FileNotFoundError) as exc:
+        return ServiceResult(
+            success=False,
+            message=f"{exc}\n({len(created)} of {len(drafts)} draft(s) created before the error.)",
+            data={"drafts": created},
+        )
+
+    lines = [f"{len(created)} draft(s) created in Outlook (To: {to}):"]
+    lines.extend(f"  {meta['subject']}" for meta in created)
+    return ServiceResult(
+        success=True,
+        message="\n".join(lines),
+        data={"drafts": created},
+    )
+
+
+def draft_daily_week(
+    firm: str,
+    week_of: str,
+    config: dict | None = None,
+) -> ServiceResult:
+    """Create Outlook drafts for every invoiced appearance in a week.
+
+    *week_of* is any YYYY-MM-DD date in the week.  See ``draft_daily_batch``.
+    """
+    config = resolve_config(config)
+
+    err = validate_firm(firm, config)
+    if err:
+        return ServiceResult(success=False, message=err)
+
+    ref = parse_iso_date(week_of)
+    if ref is None:
+        return ServiceResult(success=False, message=f"Invalid date: {week_of}. Use YYYY-MM-DD.")
+
+    try:
+        cases = query_by_date_range(firm, *week_range(ref))
+    except FileNotFoundError as exc:
+        return ServiceResult(success=False, message=str(exc))
+
+    keys = [
+        (str(c["index_number"]), str(c["appearance_date"]))
+        for c in cases if c.get("invoice_number")
+    ]
+    if not keys:
+        return ServiceResult(
+            success=False,
+            message=f"No invoiced appearances for '{firm}' in that week.",
+        )
+
+    return draft_daily_batch(firm, keys, config=config)
+
+
 def draft_weekly(
     firm: str,
     week_of: str,
@@ -230,15 +374,14 @@ def draft_weekly(
     The PDF must already exist (run ``generate-weekly`` first).
     Returns draft metadata in ``data``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
-    try:
-        ref = _date.fromisoformat(week_of)
-    except ValueError:
+    ref = parse_iso_date(week_of)
+    if ref is None:
         return ServiceResult(success=False, message=f"Invalid date: {week_of}. Use YYYY-MM-DD.")
 
     monday, friday = week_range(ref)
@@ -265,6 +408,8 @@ def draft_weekly(
     subject = f"Weekly Statement of Account - {firm} - Week of {week_label}"
     body = _weekly_body(firm, monday, friday)
 
+    from src.email_draft import create_draft
+
     try:
         meta = create_draft(to=to, subject=subject, body_html=body, cc=cc, attachment_paths=[pdf])
     except (OSError, FileNotFoundError) as exc:
@@ -288,9 +433,9 @@ def draft_monthly(
     The PDF must already exist (run ``generate-monthly`` first).
     Returns draft metadata in ``data``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = validate_firm(firm, config)
     if err:
         return ServiceResult(success=False, message=err)
 
@@ -316,10 +461,12 @@ def draft_monthly(
     cc_list = firm_cfg.get("cc_emails", [])
     cc = "; ".join(cc_list) if cc_list else None
 
-    month_name = calendar.month_name[month]
+    month_name = _MONTH_NAME[month]
     subject = f"Monthly Statement of Account - {firm} - {month_name} {year}"
     body = _monthly_body(firm, year, month)
 
+    from src.email_draft import create_draft
+
     try:
         meta = create_draft(to=to, subject=subject, body_html=body, cc=cc, attachment_paths=[pdf])
     except (OSError, FileNotFoundError) as exc:
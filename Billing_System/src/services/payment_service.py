@@ -2,27 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import date as _date
-
-from src.config import load_config
-from src.dataset import all_firm_names
-from src.payment import mark_payment
-from src.services import ServiceResult
+from src.payment import mark_payment, mark_payments
+from src.services import ServiceResult, parse_iso_date, resolve_config, validate_firm
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
-def _resolve_config(config: dict | None) -> dict:
-    if config is None:
-        return load_config()
-    return config
-
-
-def _validate_firm(firm: str, config: dict) -> str | None:
-    known = all_firm_names(config)
-    if firm not in known:
-        return f"Firm '{firm}' not found. Available: {known}"
+def _validate_inputs(firm: str, payment_date: str | None, config: dict) -> str | None:
+    err = validate_firm(firm, config)
+    if err:
+        return err
+    if payment_date and parse_iso_date(payment_date) is None:
+        return f"Invalid date: {payment_date}. Use YYYY-MM-DD."
     return None
 
 
@@ -41,21 +33,12 @@ def mark_paid(
 
     Returns the updated row in ``data["updated_row"]``.
     """
-    config = _resolve_config(config)
+    config = resolve_config(config)
 
-    err = _validate_firm(firm, config)
+    err = _validate_inputs(firm, payment_date, config)
     if err:
         return ServiceResult(success=False, message=err)
 
-    if payment_date:
-        try:
-            _date.fromisoformat(payment_date)
-        except ValueError:
-            return ServiceResult(
-                success=False,
-                message=f"Invalid date: {payment_date}. Use YYYY-MM-DD.",
-            )
-
     try:
         updated = mark_payment(firm, invoice_number, status, payment_date, notes)
     except (ValueError, FileNotFoundError) as exc:
@@ -64,7 +47,7 @@ def mark_paid(
     lines = [f"Payment updated: {firm}"]
     lines.append(f"  Invoice:      {invoice_number}")
     lines.append(f"  Case:         {updated.get('case_caption', '')}")
-    lines.append(f"  Amount:       ${float(updated.get('charge_amount') or 0):,.2f}")
+    lines.append(f"  Amount:       ${updated.get('charge_amount_str', '0.00')}")
     lines.append(f"  Status:       {updated.get('paid_status', '')}")
     lines.append(f"  Payment date: {updated.get('payment_date', '')}")
     if notes:
@@ -75,3 +58,44 @@ def mark_paid(
         message="\n".join(lines),
         data={"updated_row": updated, "invoice_number": invoice_number},
     )
+
+
+def mark_paid_many(
+    firm: str,
+    invoice_numbers: list[str],
+    status: str,
+    payment_date: str | None = None,
+    notes: str | None = None,
+    config: dict | None = None,
+) -> ServiceResult:
+    """Apply one payment status to several invoices in a single dataset write.
+
+    Returns the updated rows in ``data["updated_rows"]`` (input order).
+    """
+    config = resolve_config(config)
+
+    err = _validate_inputs(firm, payment_date, config)
+    if err:
+        return ServiceResult(success=False, message=err)
+
+    try:
+        updated_rows = mark_payments(firm, invoice_numbers, status, payment_date, notes)
+    except (ValueError, FileNotFoundError) as exc:
+        return ServiceResult(success=False, message=str(exc))
+
+    lines = [f"Payments updated: {firm} ({len(updated_rows)} invoice(s))"]
+    for inv, updated in zip(invoice_numbers, updated_rows):
+        lines.append(
+            f"  {inv}  {updated.get('case_caption', '')}"
+            f"  ${updated.get('charge_amount_str', '0.00')}"
+            f"  {updated.get('paid_status', '')}"
+            f"  {updated.get('payment_date', '')}"
+        )
+    if notes:
+        lines.append(f"  Notes: {notes}")
+
+    return ServiceResult(
+        success=True,
+        message="\n".join(lines),
+        data={"updated_rows": updated_rows, "invoice_numbers": list(invoice_numbers)},
+    )
@@ -1,13 +1,15 @@
 """Standalone script to validate master_cases.xlsx per firm.
 
 Usage:
-    python -m src.validate_dataset [--firm "ABC Law"]
+    python -m src.validate_dataset [--firm "ABC Law"] [--workers N]
 """
 
 import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 from src.config import load_config
-from src.dataset import all_firm_names, dataset_path, load_dataset, validate_dataset
+from src.dataset import all_firm_names, dataset_path, validate_dataset
 
 
 def main():
@@ -19,27 +21,43 @@ def main():
         default=None,
         help="Firm name (omit to validate all firms).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Validate up to N firms in parallel processes (default: 1).",
+    )
     args = parser.parse_args()
 
     cfg = load_config()
     firms = [args.firm] if args.firm else all_firm_names(cfg)
     total_errors = 0
 
-    for name in firms:
+    workers = max(1, min(args.workers, len(firms)))
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(validate_dataset, firms)
+    else:
+        executor = None
+        results = map(validate_dataset, firms)
+
+    # Results stream back in firm order, so output matches a serial run.
+    # Each firm's report is written in one call rather than a print per line.
+    for name, (errors, row_count) in zip(firms, results):
         path = dataset_path(name)
-        print(f"--- {name} ---")
-        print(f"  File: {path}")
+        out = [f"--- {name} ---", f"  File: {path}"]
 
-        errors = validate_dataset(name)
         if errors:
-            print(f"  FAILED - {len(errors)} error(s):")
-            for err in errors:
-                print(f"    - {err}")
+            out.append(f"  FAILED - {len(errors)} error(s):")
+            out.extend(f"    - {err}" for err in errors)
             total_errors += len(errors)
         else:
-            rows = load_dataset(name)
-            print(f"  OK - {len(rows)} data row(s)")
-        print()
+            out.append(f"  OK - {row_count} data row(s)")
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
+
+    if executor is not None:
+        executor.shutdown()
 
     if total_errors:
         print(f"Total errors across all firms: {total_errors}")
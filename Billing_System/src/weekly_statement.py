@@ -9,23 +9,37 @@ Output structure:
     invoice/{FirmName}/{YYYY}/{Mon}/Week of MM-DD-YYYY/Week of MM-DD-YYYY.pdf
 """
 
+import contextlib
 import copy
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from io import BytesIO
 from pathlib import Path
 
 from docx import Document
+from docx.oxml.ns import nsmap
 from docx.shared import Pt
-from docx2pdf import convert
+from lxml import etree
 
 from src.config import get_firm, load_config
 from src.dataset import PROJECT_ROOT, get_data_root, query_by_date_range, week_range, _to_date
-from src.doc_generator import _format_date_display
+from src.doc_generator import _fmt_mdy, _format_date_display, _replace_many, open_template
+from src.pdf_convert import convert_many
 
 TEMPLATE_PATH = PROJECT_ROOT / "template" / "weekly_statement.docx"
 
 
 # ── Cross-run placeholder replacement ────────────────────────────────
 
+# Paragraphs whose text contains "[[" (a superset of those with a token
+# in their runs).  libxml2 evaluates the filter, so the many empty cells
+# in a statement table never reach Python.
+_W = {"w": nsmap["w"]}
+_TOKEN_PARAGRAPHS = etree.XPath('.//w:p[contains(string(.), "[[")]', namespaces=_W)
+_TOKEN_BODY_PARAGRAPHS = etree.XPath('./w:p[contains(string(.), "[[")]', namespaces=_W)
+
+
 def _replace_in_paragraph(paragraph, placeholders: dict[str, str]) -> None:
     """Replace [[placeholder]] tokens that may span multiple runs.
 
@@ -33,7 +47,22 @@ def _replace_in_paragraph(paragraph, placeholders: dict[str, str]) -> None:
     back into runs (all text goes into the first run; remaining runs are
     cleared).  This preserves the first run's formatting.
     """
-    runs = paragraph.runs
+    _replace_in_p(paragraph._p, placeholders)
+
+
+def _replace_in_element(element, placeholders: dict[str, str]) -> None:
+    """``_replace_in_paragraph`` for every paragraph under an oxml element.
+
+    Pass e.g. ``table._tbl`` or ``row._tr``.
+    """
+    for p in _TOKEN_PARAGRAPHS(element):
+        _replace_in_p(p, placeholders)
+
+
+def _replace_in_p(p, placeholders: dict[str, str]) -> None:
+    # Work on the w:r elements directly — most paragraphs hold no
+    # placeholder, and this keeps the miss path free of Run wrappers.
+    runs = p.r_lst
     if not runs:
         return
 
@@ -43,9 +72,7 @@ def _replace_in_paragraph(paragraph, placeholders: dict[str, str]) -> None:
     if "[[" not in full_text:
         return
 
-    new_text = full_text
-    for token, value in placeholders.items():
-        new_text = new_text.replace(token, value)
+    new_text = _replace_many(full_text, placeholders)
 
     if new_text == full_text:
         return  # nothing changed
@@ -58,50 +85,138 @@ def _replace_in_paragraph(paragraph, placeholders: dict[str, str]) -> None:
 
 def _replace_all_placeholders(doc: Document, placeholders: dict[str, str]) -> None:
     """Replace placeholders in all paragraphs and table cells."""
-    for paragraph in doc.paragraphs:
-        _replace_in_paragraph(paragraph, placeholders)
-
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    _replace_in_paragraph(paragraph, placeholders)
+    for p in _TOKEN_PARAGRAPHS(doc.element.body):
+        _replace_in_p(p, placeholders)
 
 
 # ── Table row helpers ────────────────────────────────────────────────
 
-def _clone_row(table, source_row_idx: int) -> None:
-    """Clone a table row (deep copy of XML) and insert it right after the source row."""
-    source_tr = table.rows[source_row_idx]._tr
-    new_tr = copy.deepcopy(source_tr)
-    source_tr.addnext(new_tr)
+def _clone_row(table, source_row_idx: int, count: int = 1) -> None:
+    """Insert *count* deep copies of a table row's XML right after the source row."""
+    source_tr = table._tbl.tr_lst[source_row_idx]
+    for _ in range(count):
+        source_tr.addnext(copy.deepcopy(source_tr))
 
 
-def _set_cell_text(row, col_idx: int, text: str) -> None:
+_RUN_SIZE = Pt(10)
+
+
+def _set_cell_text(cell, text: str) -> None:
     """Set cell text preserving existing paragraph/run formatting.
 
     If the cell has existing runs, reuses the first run's formatting.
     If empty (no runs), creates a run matching the template style
     (Calibri 10pt).
     """
-    cell = row.cells[col_idx]
-    for paragraph in cell.paragraphs:
-        runs = paragraph.runs
+    _set_tc_text(cell._tc, text)
+
+
+def _set_tc_text(tc, text: str) -> None:
+    """``_set_cell_text`` on a raw ``<w:tc>`` element.
+
+    Works on the underlying XML to skip python-docx's per-cell,
+    per-paragraph and per-run wrapper objects.  New runs get the same
+    ``<w:rPr>`` that ``run.font`` would write.
+    """
+    for p in tc.p_lst:
+        runs = p.r_lst
         if runs:
             runs[0].text = text
             for r in runs[1:]:
                 r.text = ""
         else:
-            run = paragraph.add_run(text)
-            run.font.name = "Calibri"
-            run.font.size = Pt(10)
-            run.font.bold = False
+            r = p.add_r()
+            if text:
+                r.text = text
+            rPr = r.get_or_add_rPr()
+            rPr.rFonts_ascii = rPr.rFonts_hAnsi = "Calibri"
+            rPr.sz_val = _RUN_SIZE
+            rPr._set_bool_val("b", False)
+
+
+def _set_row_text(row, texts: list[str]) -> None:
+    """Set each cell of a row from *texts*, walking the row's ``<w:tc>`` list.
+
+    Skips ``row.cells``, which builds a ``_Cell`` per grid column (and on
+    older python-docx, the whole table grid) for every row.  Rows with
+    spanned or merged cells fall back to ``row.cells`` so the column
+    mapping stays the same.
+    """
+    tcs = row._tr.tc_lst
+    if any(tc.grid_span != 1 or tc.vMerge is not None for tc in tcs):
+        for cell, text in zip(row.cells, texts):
+            _set_cell_text(cell, text)
+        return
+    for tc, text in zip(tcs, texts):
+        _set_tc_text(tc, text)
+
+
+def _case_row_texts(cases: list[dict]) -> tuple[list[list[str]], float]:
+    """Return the case table's cell texts per case, and the total fee."""
+    amounts = [float(case.get("charge_amount") or 0) for case in cases]
+    texts = []
+    for case, amt in zip(cases, amounts):
+        d = _to_date(case.get("appearance_date"))
+        texts.append([
+            _fmt_mdy(d) if d else "",
+            str(case.get("index_number") or ""),
+            str(case.get("case_caption") or ""),
+            f"${amt:,.2f}",
+        ])
+    return texts, sum(amounts)
+
+
+def _save_docx(doc, output_docx: Path, defer_write=None) -> None:
+    """Save *doc*; with *defer_write*, serialise now and hand the disk write off.
+
+    *defer_write* is called as ``defer_write(fn, *args)`` (see
+    ``_background_writes``) so the write overlaps the next render.
+    """
+    output_docx.parent.mkdir(parents=True, exist_ok=True)
+    if defer_write is None:
+        doc.save(str(output_docx))
+        return
+    buf = BytesIO()
+    doc.save(buf)
+    defer_write(_write_bytes, output_docx, buf.getvalue())
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path*, removing a partly written file on failure."""
+    try:
+        path.write_bytes(data)
+    except OSError:
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+        raise
+
+
+class _background_writes:
+    """Context manager running deferred .docx writes on one I/O thread.
+
+    Used as the *defer_write* callable; on exit every write is waited on
+    and the first failure is re-raised.  If the block itself raised, write
+    failures are reported as warnings rather than lost behind that error.
+    """
+
+    def __enter__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._futures = []
+        return self
 
+    def __call__(self, fn, *args) -> None:
+        self._futures.append(self._pool.submit(fn, *args))
 
-def _clear_row(row, num_cols: int) -> None:
-    """Clear all cells in a row."""
-    for i in range(num_cols):
-        _set_cell_text(row, i, "")
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._pool.shutdown(wait=True)
+        if exc_type is None:
+            for future in self._futures:
+                future.result()
+            return
+        for future in self._futures:
+            error = future.exception()
+            if error is not None:
+                warnings.warn(f"Statement .docx write failed: {error}", stacklevel=2)
 
 
 # ── Fill template ────────────────────────────────────────────────────
@@ -113,9 +228,10 @@ def _fill_weekly_template(
     cases: list[dict],
     firm: dict,
     output_docx: Path,
+    defer_write=None,
 ) -> Path:
     """Fill the weekly_statement.docx template and save."""
-    doc = Document(str(TEMPLATE_PATH))
+    doc = open_template(TEMPLATE_PATH)
 
     # Period string: "02/16/26 - 02/20/26"
     period_str = f"{monday.strftime('%m/%d/%y')} - {friday.strftime('%m/%d/%y')}"
@@ -131,19 +247,17 @@ def _fill_weekly_template(
     }
 
     # Replace header/body placeholders (paragraphs + table[0] title)
-    for paragraph in doc.paragraphs:
-        _replace_in_paragraph(paragraph, header_placeholders)
+    for p in _TOKEN_BODY_PARAGRAPHS(doc.element.body):
+        _replace_in_p(p, header_placeholders)
 
     # Also replace in table[0] (the "WEEKLY STATMENT" banner) in case it has placeholders
-    if doc.tables:
-        for row in doc.tables[0].rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    _replace_in_paragraph(paragraph, header_placeholders)
+    # (doc.tables wraps every body table on each access, so read it once)
+    tables = doc.tables
+    if tables:
+        _replace_in_element(tables[0]._tbl, header_placeholders)
 
     # ── Fill case table (table[1]) ───────────────────────────────────
-    case_table = doc.tables[1]
-    num_cols = 4  # Date, Index No., Case Caption, Amount
+    case_table = tables[1]
 
     # Template has: row 0 = header, row 1 = template data row,
     # rows 2-25 = empty, row 26 = total row.
@@ -155,65 +269,46 @@ def _fill_weekly_template(
     if len(cases) > pre_allocated:
         extra_needed = len(cases) - pre_allocated
         # Insert clones before the total row (after last pre-allocated row)
-        for _ in range(extra_needed):
-            _clone_row(case_table, 1)  # clone template row format
+        _clone_row(case_table, 1, extra_needed)  # clone template row format
         # Total row index shifts
         total_row_idx = 1 + len(cases)
 
+    # Format all cell texts first, then write them
+    case_texts, total_fee = _case_row_texts(cases)
+
     # Fill case data into rows 1..N
-    total_fee = 0.0
-    for i, case in enumerate(cases):
-        row = case_table.rows[1 + i]
-        d = _to_date(case.get("appearance_date"))
-        date_str = d.strftime("%m/%d/%Y") if d else ""
-        amt = float(case.get("charge_amount") or 0)
-        total_fee += amt
-
-        _set_cell_text(row, 0, date_str)
-        _set_cell_text(row, 1, str(case.get("index_number") or ""))
-        _set_cell_text(row, 2, str(case.get("case_caption") or ""))
-        _set_cell_text(row, 3, f"${amt:,.2f}")
-
-    # Clear any unused pre-allocated rows (if fewer cases than slots)
-    used_data_rows = len(cases)
-    total_data_slots = max(pre_allocated, len(cases))
-    for i in range(used_data_rows, total_data_slots):
-        row = case_table.rows[1 + i]
-        _clear_row(row, num_cols)
+    # (table.rows[i] rebuilds every row wrapper, so materialize them once)
+    rows = list(case_table.rows)
+    for row, texts in zip(rows[1:], case_texts):
+        _set_row_text(row, texts)
+
+    # Drop unused pre-allocated rows (fewer cases than slots) rather than
+    # blanking them cell by cell; the total row then follows the last case
+    for row in rows[1 + len(cases):1 + pre_allocated]:
+        case_table._tbl.remove(row._tr)
 
     # Replace [[total fee]] in the total row
-    total_row = case_table.rows[total_row_idx]
-    for cell in total_row.cells:
-        for paragraph in cell.paragraphs:
-            _replace_in_paragraph(paragraph, {
-                "[[total fee]]": f"{total_fee:,.2f}",
-            })
-
-    # Also clear placeholder from template row 1 if no cases
-    if not cases:
-        row1 = case_table.rows[1]
-        for placeholder in ["[[case date]]", "[[case no]]", "[[case caption]]", "[[case fee]]"]:
-            for cell in row1.cells:
-                for paragraph in cell.paragraphs:
-                    _replace_in_paragraph(paragraph, {placeholder: ""})
+    total_row = rows[total_row_idx]
+    _replace_in_element(total_row._tr, {
+        "[[total fee]]": f"{total_fee:,.2f}",
+    })
 
-    output_docx.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(str(output_docx))
+    _save_docx(doc, output_docx, defer_write)
     return output_docx
 
 
 # ── Full pipeline ────────────────────────────────────────────────────
 
-def generate_weekly_statement(
+def render_weekly_statement(
     firm_name: str,
     week_of: date,
     config: dict | None = None,
-    keep_docx: bool = False,
-) -> Path:
-    """Generate a weekly statement PDF for a firm.
+    defer_write=None,
+) -> tuple[Path, Path]:
+    """Fill the weekly template for a firm without converting it.
 
-    week_of: any date within the desired week (Mon-Fri range is computed).
-    Returns the path to the generated PDF.
+    Returns (docx_path, pdf_path) — the PDF path is where conversion should write.
+    With *defer_write* the .docx may not be on disk until that writer finishes.
     """
     if config is None:
         config = load_config()
@@ -234,14 +329,65 @@ def generate_weekly_statement(
     pdf_out = base_dir / f"{week_folder}.pdf"
 
     # Fill template
-    _fill_weekly_template(firm_name, monday, friday, cases, firm, docx_out)
+    _fill_weekly_template(
+        firm_name, monday, friday, cases, firm, docx_out, defer_write
+    )
+    return docx_out, pdf_out
+
+
+def generate_weekly_statement(
+    firm_name: str,
+    week_of: date,
+    config: dict | None = None,
+    keep_docx: bool = False,
+    pdf: bool = True,
+) -> Path:
+    """Generate a weekly statement PDF for a firm.
+
+    week_of: any date within the desired week (Mon-Fri range is computed).
+    Returns the path to the generated PDF (the .docx when ``pdf=False``).
+    """
+    return generate_weekly_statements(
+        [firm_name], week_of, config, keep_docx, pdf=pdf
+    )[firm_name]
+
+
+def generate_weekly_statements(
+    firm_names: list[str],
+    week_of: date,
+    config: dict | None = None,
+    keep_docx: bool = False,
+    workers: int = 1,
+    pdf: bool = True,
+) -> dict[str, Path]:
+    """Generate weekly statement PDFs for several firms in one conversion batch.
+
+    All templates are filled first, then converted together, split across
+    *workers* converter instances.  Returns {firm_name: pdf_path}.
+
+    With ``pdf=False`` conversion is skipped entirely and the filled .docx
+    files are kept; returns {firm_name: docx_path}.
+    """
+    if config is None:
+        config = load_config()
+
+    # Each .docx is written on a background thread while the next firm renders;
+    # a single statement has nothing to overlap and is saved directly.
+    writes = _background_writes() if len(firm_names) > 1 else contextlib.nullcontext()
+    with writes as defer_write:
+        rendered = {
+            name: render_weekly_statement(name, week_of, config, defer_write)
+            for name in firm_names
+        }
+    if not pdf:
+        return {name: docx_out for name, (docx_out, _) in rendered.items()}
 
-    # Convert to PDF
-    pdf_out.parent.mkdir(parents=True, exist_ok=True)
-    convert(str(docx_out), str(pdf_out))
+    convert_many(list(rendered.values()), workers=workers)
 
     # Clean up intermediate .docx (don't remove week folder — it has other files)
-    if not keep_docx and docx_out.exists():
-        docx_out.unlink()
+    if not keep_docx:
+        for docx_out, _ in rendered.values():
+            if docx_out.exists():
+                docx_out.unlink()
 
-    return pdf_out
+    return {name: pdf_out for name, (_, pdf_out) in rendered.items()}
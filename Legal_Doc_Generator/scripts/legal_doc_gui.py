@@ -1,104 +1,161 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkcalendar import DateEntry
-from docxtpl import DocxTemplate
+import itertools
 import os
+import subprocess
 import sys
+import threading
 from datetime import datetime
 
 
+_NUMBER_WORDS = (
+    '', 'one', 'two', 'three', 'four', 'five',
+    'six', 'seven', 'eight', 'nine', 'ten',
+    'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen',
+    'sixteen', 'seventeen', 'eighteen', 'nineteen', 'twenty'
+)
+
+
 def number_to_words(num):
     """Convert number to words (1-20+)"""
-    words = {
-        '1': 'one', '2': 'two', '3': 'three', '4': 'four', '5': 'five',
-        '6': 'six', '7': 'seven', '8': 'eight', '9': 'nine', '10': 'ten',
-        '11': 'eleven', '12': 'twelve', '13': 'thirteen', '14': 'fourteen', '15': 'fifteen',
-        '16': 'sixteen', '17': 'seventeen', '18': 'eighteen', '19': 'nineteen', '20': 'twenty'
+    try:
+        n = int(num)
+    except (TypeError, ValueError):
+        return str(num)
+    return _NUMBER_WORDS[n] if 0 < n < len(_NUMBER_WORDS) else str(num)
+
+
+# Template and output folders: bundled into / next to the executable when
+# frozen, otherwise relative to the project root
+if getattr(sys, 'frozen', False):
+    TEMPLATE_DIR = sys._MEIPASS
+    OUTPUT_DIR = os.path.join(os.path.dirname(sys.executable), "output")
+else:
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    TEMPLATE_DIR = os.path.join(_PROJECT_ROOT, "templates", "HO")
+    OUTPUT_DIR = os.path.join(_PROJECT_ROOT, "output")
+
+
+# Dates as written in the petition, and the output filename timestamp
+_DATE_FORMAT = "%B %d, %Y"
+_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+# Output filename cleanup: spaces become underscores; commas and characters
+# Windows rejects in filenames are dropped
+_FILENAME_TRANS = str.maketrans({" ": "_", **dict.fromkeys(',/\\:*?"<>|', None)})
+
+
+# Court county and address per court selection
+COURT_ADDRESSES = {
+    "Queens": {
+        "county": "QUEENS",
+        "address1": "89-17 Sutphin Blvd",
+        "address2": "Jamaica, NY 11435"
+    },
+    "Kings": {
+        "county": "KINGS",
+        "address1": "141 Livingston Street",
+        "address2": "Brooklyn, NY 11201"
+    },
+    "Bronx": {
+        "county": "BRONX",
+        "address1": "1118 Grand Concourse",
+        "address2": "Bronx, NY 10456"
     }
-    return words.get(str(num), str(num))
-
-
-def generate_petition(template_path, output_path, petition_data):
-    """Generate petition document from template and data"""
-    # Load the template
-    doc = DocxTemplate(template_path)
-
-    # Process conditional fields based on boolean flags
-    is_petitioner_company = petition_data.get("is_petitioner_company", False)
-    is_multiple_dwelling = petition_data.get("is_multiple_dwelling", False)
-    is_under_rent_stabilization = petition_data.get("is_under_rent_stabilization", False)
-
-    # Set conditional values for company
-    if is_petitioner_company:
-        petitioner_company_not = " "  # Empty space if IS a company
-        representative_name = petition_data.get("representative_name", "")
-        representative_title = petition_data.get("representative_title", "")
-        # Complete signature line for company including "By:" and comma
-        company_signature_line = "By:______________________________________,"
+}
+
+
+def _conditional_fields(is_company, is_multiple_dwelling, is_rent_stabilized):
+    """Fixed context strings for one combination of the petition flags"""
+    fields = {
+        # "not" if NOT a company, space if IS a company
+        "PETITIONER_IS_COMPANY_NOT": " " if is_company else "not",
+        # Complete signature line for company including "By:" and comma;
+        # completely empty otherwise - no "By:", no underline, no comma
+        "COMPANY_SIGNATURE_LINE": "By:______________________________________," if is_company else "",
+        # Multiple dwelling checkboxes: X in exactly one of them
+        "NO_X": " " if is_multiple_dwelling else "X",
+        "X_IS": "X" if is_multiple_dwelling else " ",
+        "RENT_STABILIZATION_NOT": " " if is_rent_stabilized else " not ",
+    }
+    if not is_company:
+        fields["REPRESENTATIVE_NAME"] = ""  # Blank instead of N/A
+        fields["rep_Title"] = ""  # Blank instead of N/A
+    if not is_multiple_dwelling:
+        fields["Nutl_No"] = "N/A"
+        fields["AGENT_NAME"] = "N/A"
+        fields["AGENT_ADDRESS"] = "N/A"
+    return fields
+
+
+# Keyed by (is company, is multiple dwelling, is rent stabilized)
+_CONDITIONAL_FIELDS = {
+    flags: _conditional_fields(*flags)
+    for flags in itertools.product((False, True), repeat=3)
+}
+
+
+def open_file(path, on_error):
+    """Open a file in its default application without blocking the UI
+
+    A failure to open is passed to *on_error* rather than raised; on
+    Windows that call comes from a worker thread.
+    """
+    if sys.platform == "win32":
+        def start():
+            try:
+                os.startfile(path)
+            except OSError as e:
+                on_error(e)
+
+        # os.startfile waits on the shell while Word cold-starts
+        threading.Thread(target=start, daemon=True).start()
     else:
-        petitioner_company_not = "not"  # "not" if NOT a company
-        representative_name = ""  # Blank instead of N/A
-        representative_title = ""  # Blank instead of N/A
-        company_signature_line = ""  # Completely empty - no "By:", no underline, no comma
+        try:
+            subprocess.Popen(["open" if sys.platform == "darwin" else "xdg-open", path])
+        except OSError as e:
+            on_error(e)
+
+
+def build_context(petition_data):
+    """Template context for one petition's form data"""
+    # Conditional fields based on boolean flags
+    is_petitioner_company = bool(petition_data.get("is_petitioner_company", False))
+    is_multiple_dwelling = bool(petition_data.get("is_multiple_dwelling", False))
+    is_under_rent_stabilization = bool(petition_data.get("is_under_rent_stabilization", False))
+    context = dict(_CONDITIONAL_FIELDS[
+        is_petitioner_company, is_multiple_dwelling, is_under_rent_stabilization
+    ])
+
+    # Only the data-dependent fields are left to fill in
+    if is_petitioner_company:
+        context["REPRESENTATIVE_NAME"] = petition_data.get("representative_name", "")
+        context["rep_Title"] = petition_data.get("representative_title", "")
 
-    # Set conditional values for multiple dwelling checkboxes
     if is_multiple_dwelling:
-        no_x = " "  # Blank space for "not multiple dwelling" checkbox
-        x_is = "X"  # X for "is multiple dwelling" checkbox
-        dwelling_reg_no = petition_data.get("dwelling_registration_no", "")
+        context["Nutl_No"] = petition_data.get("dwelling_registration_no", "")
 
         # Agent name logic: if company AND multiple dwelling, use representative name
         if is_petitioner_company:
-            agent_name = representative_name
+            context["AGENT_NAME"] = context["REPRESENTATIVE_NAME"]
         else:
-            agent_name = petition_data.get("agent_name", "")
+            context["AGENT_NAME"] = petition_data.get("agent_name", "")
 
         # Build agent address from respondent address (street only, no apt/room)
-        respondent_addr_line1 = petition_data["respondent_address_line1"]
-        respondent_addr_line2 = petition_data["respondent_address_line2"]
         # Extract street address (first part before comma)
-        street_only = respondent_addr_line1.split(",")[0].strip()
-        agent_address = f"{street_only}, {respondent_addr_line2}"
-    else:
-        no_x = "X"  # X for "not multiple dwelling" checkbox
-        x_is = " "  # Blank space for "is multiple dwelling" checkbox
-        dwelling_reg_no = "N/A"
-        agent_name = "N/A"
-        agent_address = "N/A"
-
-    rent_stabilization_not = " " if is_under_rent_stabilization else " not "
+        street_only = petition_data["respondent_address_line1"].partition(",")[0].strip()
+        context["AGENT_ADDRESS"] = f"{street_only}, {petition_data['respondent_address_line2']}"
 
     # Convert number of family to words
     number_of_family = petition_data.get("number_of_family", "1")
-    number_of_family_words = number_to_words(number_of_family)
 
     # Court addresses based on selection
-    court_part = petition_data.get("court_part", "Queens")
-    court_addresses = {
-        "Queens": {
-            "county": "QUEENS",
-            "address1": "89-17 Sutphin Blvd",
-            "address2": "Jamaica, NY 11435"
-        },
-        "Kings": {
-            "county": "KINGS",
-            "address1": "141 Livingston Street",
-            "address2": "Brooklyn, NY 11201"
-        },
-        "Bronx": {
-            "county": "BRONX",
-            "address1": "1118 Grand Concourse",
-            "address2": "Bronx, NY 10456"
-        }
-    }
-
-    court_info = court_addresses.get(court_part, court_addresses["Queens"])
-    court_county = court_info["county"]
-    court_address1 = court_info["address1"]
-    court_address2 = court_info["address2"]
+    court_info = COURT_ADDRESSES.get(petition_data.get("court_part", "Queens"), COURT_ADDRESSES["Queens"])
 
-    # Define the context (data to fill)
-    context = {
+    # The rest of the context (data to fill)
+    context.update({
         "PETITIONER_NAME": petition_data["petitioner_name"],
         "PETITIONER_ADDRESS_LINE1": petition_data["petitioner_address_line1"],
         "PETITIONER_ADDRESS_LINE2": petition_data["petitioner_address_line2"],
@@ -107,40 +164,48 @@ def generate_petition(template_path, output_path, petition_data):
         "RESPONDENT_ADDRESS_LINE2": petition_data["respondent_address_line2"],
         "DATED_DATE": petition_data["dated_date"],
         "TERMINATED_DATE": petition_data["terminated_date"],
-        # Conditional fields
-        "NO_X": no_x,
-        "X_IS": x_is,
-        "RENT_STABILIZATION_NOT": rent_stabilization_not,
-        "PETITIONER_IS_COMPANY_NOT": petitioner_company_not,
-        "REPRESENTATIVE_NAME": representative_name,
-        "rep_Title": representative_title,
-        "COMPANY_SIGNATURE_LINE": company_signature_line,
-        "Nutl_No": dwelling_reg_no,
-        "AGENT_NAME": agent_name,
-        "AGENT_ADDRESS": agent_address,
         # Notice information
         "NOTICE_DAYS": petition_data["notice_days"],
         "NOTICE_TYPE": petition_data["notice_type"],
         # Family information
         "NUMBER_OF_FAMILY": number_of_family,
-        "NUMBER_OF_FAMILY_WORDS": number_of_family_words,
+        "NUMBER_OF_FAMILY_WORDS": number_to_words(number_of_family),
         # Case information
         "FILE_NUMBER": petition_data["file_number"],
-        "COURT_COUNTY": court_county,
-        "COURT_ADDRESS_LINE1": court_address1,
-        "COURT_ADDRESS_LINE2": court_address2
-    }
+        "COURT_COUNTY": court_info["county"],
+        "COURT_ADDRESS_LINE1": court_info["address1"],
+        "COURT_ADDRESS_LINE2": court_info["address2"]
+    })
 
     # Add extra respondent names (RESPONDENT2_NAME through RESPONDENT6_NAME)
     for i in range(2, 7):
         context[f"RESPONDENT{i}_NAME"] = petition_data.get(f"respondent{i}_name", "")
 
-    # Render the template
-    doc.render(context)
+    return context
+
+
+def generate_petition(template_path, output_path, petition_data):
+    """Generate petition document from template and data"""
+    # Imported here: lxml is only needed once a document is generated,
+    # and keeping it out of module import lets the window appear sooner
+    from petition_render import render_template
 
-    # Save the result
-    doc.save(output_path)
-    return output_path
+    return render_template(template_path, output_path, build_context(petition_data))
+
+
+def generate_petitions(template_path, jobs):
+    """Generate several petitions from one template
+
+    *jobs* yields ``(output_path, petition_data)`` pairs.  The template is
+    parsed once and each file is written while the next one renders.
+    Returns the output paths.
+    """
+    from petition_render import render_many
+
+    return render_many(
+        template_path,
+        ((output_path, build_context(data)) for output_path, data in jobs),
+    )
 
 
 class LegalDocApp:
@@ -150,10 +215,22 @@ class LegalDocApp:
         self.root.geometry("700x850")
         self.root.resizable(False, False)
 
+        # Label styles, registered once and shared by the form's labels
+        style = ttk.Style(self.root)
+        style.configure("Title.TLabel", font=("Arial", 16, "bold"))
+        style.configure("Subtitle.TLabel", font=("Arial", 10))
+        style.configure("Section.TLabel", font=("Arial", 11, "bold"))
+        style.configure("Hint.TLabel", font=("Arial", 8, "italic"), foreground="gray")
+
         # Create scrollable frame
         self.create_scrollable_frame()
         self.create_form()
 
+        # Check the base template now rather than after the user has
+        # filled in the form
+        if not os.path.exists(self.get_template_path()):
+            self.status_var.set(f"Warning: templates not found in {TEMPLATE_DIR}")
+
     def create_scrollable_frame(self):
         """Create canvas with scrollbar"""
         canvas = tk.Canvas(self.root)
@@ -187,11 +264,11 @@ class LegalDocApp:
 
         # Title
         ttk.Label(self.scrollable_frame, text="Legal Document Generator",
-                 font=("Arial", 16, "bold")).grid(row=row, column=0, columnspan=2, pady=10)
+                 style="Title.TLabel").grid(row=row, column=0, columnspan=2, pady=10)
         row += 1
 
         ttk.Label(self.scrollable_frame, text="HO NPP Template",
-                 font=("Arial", 10)).grid(row=row, column=0, columnspan=2, pady=5)
+                 style="Subtitle.TLabel").grid(row=row, column=0, columnspan=2, pady=5)
         row += 1
 
         ttk.Separator(self.scrollable_frame, orient="horizontal").grid(
@@ -201,7 +278,7 @@ class LegalDocApp:
 
         # PETITIONER SECTION
         ttk.Label(self.scrollable_frame, text="PETITIONER INFORMATION",
-                 font=("Arial", 11, "bold")).grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
+                 style="Section.TLabel").grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
         row += 1
 
         ttk.Label(self.scrollable_frame, text="Name: *").grid(row=row, column=0, sticky="w", padx=20, pady=5)
@@ -246,7 +323,7 @@ class LegalDocApp:
 
         # RESPONDENT SECTION
         ttk.Label(self.scrollable_frame, text="RESPONDENT INFORMATION",
-                 font=("Arial", 11, "bold")).grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
+                 style="Section.TLabel").grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
         row += 1
 
         ttk.Label(self.scrollable_frame, text="Respondent 1 Name: *").grid(row=row, column=0, sticky="w", padx=20, pady=5)
@@ -285,7 +362,7 @@ class LegalDocApp:
 
         # DATES SECTION
         ttk.Label(self.scrollable_frame, text="DATES",
-                 font=("Arial", 11, "bold")).grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
+                 style="Section.TLabel").grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
         row += 1
 
         ttk.Label(self.scrollable_frame, text="Document Date: *").grid(row=row, column=0, sticky="w", padx=20, pady=5)
@@ -309,7 +386,7 @@ class LegalDocApp:
 
         # CASE INFORMATION SECTION
         ttk.Label(self.scrollable_frame, text="CASE INFORMATION",
-                 font=("Arial", 11, "bold")).grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
+                 style="Section.TLabel").grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
         row += 1
 
         ttk.Label(self.scrollable_frame, text="File Number: *").grid(row=row, column=0, sticky="w", padx=20, pady=5)
@@ -331,7 +408,7 @@ class LegalDocApp:
 
         # PROPERTY SECTION
         ttk.Label(self.scrollable_frame, text="PROPERTY INFORMATION",
-                 font=("Arial", 11, "bold")).grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
+                 style="Section.TLabel").grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
         row += 1
 
         self.is_multiple_dwelling = tk.BooleanVar()
@@ -360,7 +437,7 @@ class LegalDocApp:
         row += 1
 
         ttk.Label(self.scrollable_frame, text="(Agent address auto-generated)",
-                 font=("Arial", 8, "italic"), foreground="gray").grid(
+                 style="Hint.TLabel").grid(
             row=row, column=0, columnspan=2, sticky="w", padx=40, pady=2
         )
         row += 1
@@ -372,7 +449,7 @@ class LegalDocApp:
 
         # NOTICE INFORMATION SECTION
         ttk.Label(self.scrollable_frame, text="NOTICE INFORMATION",
-                 font=("Arial", 11, "bold")).grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
+                 style="Section.TLabel").grid(row=row, column=0, columnspan=2, sticky="w", padx=20, pady=5)
         row += 1
 
         ttk.Label(self.scrollable_frame, text="Notice Days: *").grid(row=row, column=0, sticky="w", padx=20, pady=5)
@@ -396,7 +473,7 @@ class LegalDocApp:
         row += 1
 
         ttk.Label(self.scrollable_frame, text="(Will generate both numeric and word forms)",
-                 font=("Arial", 8, "italic"), foreground="gray").grid(
+                 style="Hint.TLabel").grid(
             row=row, column=0, columnspan=2, sticky="w", padx=40, pady=2
         )
         row += 1
@@ -424,6 +501,18 @@ class LegalDocApp:
                               relief=tk.SUNKEN, anchor=tk.W)
         status_bar.grid(row=row, column=0, columnspan=2, sticky="ew", padx=20, pady=10)
 
+        # Fields reset by clear_form
+        self._text_entries = (
+            self.petitioner_name, self.petitioner_addr1, self.petitioner_addr2,
+            self.respondent_name, self.respondent_addr1, self.respondent_addr2,
+            self.representative_name, self.representative_title,
+            self.dwelling_reg_no, self.agent_name,
+            self.number_of_family, self.file_number,
+        )
+        self._flags = (
+            self.is_petitioner_company, self.is_multiple_dwelling, self.is_rent_stabilization,
+        )
+
     def add_respondent(self):
         """Add an extra respondent name field (max 6 total)"""
         if len(self.extra_respondents) >= 5:  # respondent 1 + 5 extra = 6 max
@@ -514,72 +603,54 @@ class LegalDocApp:
 
     def validate_form(self):
         """Validate all required fields"""
-        errors = []
-
-        if not self.petitioner_name.get().strip():
-            errors.append("Petitioner name is required")
-        if not self.petitioner_addr1.get().strip():
-            errors.append("Petitioner address line 1 is required")
-        if not self.petitioner_addr2.get().strip():
-            errors.append("Petitioner address line 2 is required")
-        if not self.respondent_name.get().strip():
-            errors.append("Respondent name is required")
-        if not self.respondent_addr1.get().strip():
-            errors.append("Respondent address line 1 is required")
-        if not self.respondent_addr2.get().strip():
-            errors.append("Respondent address line 2 is required")
-
-        # Validate extra respondent names
-        for i, resp in enumerate(self.extra_respondents):
-            if not resp["entry"].get().strip():
-                errors.append(f"Respondent {i + 2} name is required")
-
-        if not self.file_number.get().strip():
-            errors.append("File number is required")
+        # (entry, message) pairs, checked in the order errors are listed
+        required = [
+            (self.petitioner_name, "Petitioner name is required"),
+            (self.petitioner_addr1, "Petitioner address line 1 is required"),
+            (self.petitioner_addr2, "Petitioner address line 2 is required"),
+            (self.respondent_name, "Respondent name is required"),
+            (self.respondent_addr1, "Respondent address line 1 is required"),
+            (self.respondent_addr2, "Respondent address line 2 is required"),
+        ]
+        # Extra respondent names
+        required += [
+            (resp["entry"], f"Respondent {i + 2} name is required")
+            for i, resp in enumerate(self.extra_respondents)
+        ]
+        required.append((self.file_number, "File number is required"))
 
-        # Check company fields
-        if self.is_petitioner_company.get():
-            if not self.representative_name.get().strip():
-                errors.append("Representative name is required when petitioner is a company")
-            if not self.representative_title.get().strip():
-                errors.append("Representative title is required when petitioner is a company")
+        # Company fields
+        is_company = self.is_petitioner_company.get()
+        if is_company:
+            required.append((self.representative_name,
+                             "Representative name is required when petitioner is a company"))
+            required.append((self.representative_title,
+                             "Representative title is required when petitioner is a company"))
 
-        # Check dwelling fields
+        # Dwelling fields
         if self.is_multiple_dwelling.get():
-            if not self.dwelling_reg_no.get().strip():
-                errors.append("Dwelling registration number is required for multiple dwelling")
-            if not self.is_petitioner_company.get():
-                if not self.agent_name.get().strip():
-                    errors.append("Agent name is required for multiple dwelling")
+            required.append((self.dwelling_reg_no,
+                             "Dwelling registration number is required for multiple dwelling"))
+            if not is_company:
+                required.append((self.agent_name, "Agent name is required for multiple dwelling"))
 
-        return errors
+        return [message for entry, message in required if not entry.get().strip()]
 
     def clear_form(self):
         """Clear all form fields"""
-        self.petitioner_name.delete(0, tk.END)
-        self.petitioner_addr1.delete(0, tk.END)
-        self.petitioner_addr2.delete(0, tk.END)
-        self.respondent_name.delete(0, tk.END)
-        self.respondent_addr1.delete(0, tk.END)
-        self.respondent_addr2.delete(0, tk.END)
-        self.representative_name.delete(0, tk.END)
-        self.representative_title.delete(0, tk.END)
-        self.dwelling_reg_no.delete(0, tk.END)
-        self.agent_name.delete(0, tk.END)
+        for entry in self._text_entries:
+            entry.delete(0, tk.END)
         # Remove all extra respondents
         for resp in self.extra_respondents:
             resp["frame"].destroy()
         self.extra_respondents = []
         self.add_respondent_btn.config(state="normal")
 
-        self.is_petitioner_company.set(False)
-        self.is_multiple_dwelling.set(False)
-        self.is_rent_stabilization.set(False)
+        for flag in self._flags:
+            flag.set(False)
         self.notice_days.current(0)  # Reset to 30
         self.notice_type.current(0)  # Reset to oral
-        self.number_of_family.delete(0, tk.END)  # Clear field
         self.number_of_family.insert(0, "1")  # Reset to 1
-        self.file_number.delete(0, tk.END)  # Clear file number
         self.court_part.current(0)  # Reset to Queens
         self.toggle_company_fields()
         self.toggle_dwelling_fields()
@@ -592,15 +663,7 @@ class LegalDocApp:
             filename = "HO NPP Template.docx"
         else:
             filename = f"HO NPP Template {respondent_count}.docx"
-
-        if getattr(sys, 'frozen', False):
-            base_path = sys._MEIPASS
-            template_path = os.path.join(base_path, filename)
-        else:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(script_dir)
-            template_path = os.path.join(project_root, "templates", "HO", filename)
-        return template_path
+        return os.path.join(TEMPLATE_DIR, filename)
 
     def generate_document(self):
         """Generate the document"""
@@ -629,8 +692,8 @@ class LegalDocApp:
                 "respondent_name": self.respondent_name.get().strip(),
                 "respondent_address_line1": self.respondent_addr1.get().strip(),
                 "respondent_address_line2": self.respondent_addr2.get().strip(),
-                "dated_date": self.dated_date.get_date().strftime("%B %d, %Y"),
-                "terminated_date": self.terminated_date.get_date().strftime("%B %d, %Y"),
+                "dated_date": self.dated_date.get_date().strftime(_DATE_FORMAT),
+                "terminated_date": self.terminated_date.get_date().strftime(_DATE_FORMAT),
                 "is_petitioner_company": self.is_petitioner_company.get(),
                 "is_multiple_dwelling": self.is_multiple_dwelling.get(),
                 "is_under_rent_stabilization": self.is_rent_stabilization.get(),
@@ -650,19 +713,12 @@ class LegalDocApp:
                 petition_data[f"respondent{i + 2}_name"] = resp["entry"].get().strip()
 
             # Generate output path
-            if getattr(sys, 'frozen', False):
-                base_path = os.path.dirname(sys.executable)
-            else:
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                base_path = os.path.dirname(script_dir)
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-            output_dir = os.path.join(base_path, "output")
-            os.makedirs(output_dir, exist_ok=True)
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            respondent_name_safe = petition_data["respondent_name"].replace(" ", "_").replace(",", "")
+            timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
+            respondent_name_safe = petition_data["respondent_name"].translate(_FILENAME_TRANS)
             output_filename = f"output_HO_{respondent_name_safe}_{timestamp}.docx"
-            output_path = os.path.join(output_dir, output_filename)
+            output_path = os.path.join(OUTPUT_DIR, output_filename)
 
             # Generate document
             generate_petition(template_path, output_path, petition_data)
@@ -673,12 +729,19 @@ class LegalDocApp:
                 f"Document generated successfully!\n\nSaved to: {output_path}\n\nWould you like to open it now?")
 
             if result:
-                os.startfile(output_path)
+                # after() hands the report back to the Tk thread
+                open_file(output_path, lambda e: self.root.after(
+                    0, self.show_open_error, output_path, e))
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate document:\n{str(e)}")
             self.status_var.set("Error generating document")
 
+    def show_open_error(self, path, error):
+        """Report a saved document that could not be opened"""
+        messagebox.showwarning("Open Failed",
+            f"Document saved to: {path}\n\nbut it could not be opened:\n{error}")
+
 
 def main():
     root = tk.Tk()
@@ -0,0 +1,128 @@
+"""Fill {{ NAME }} placeholders in a .docx without docxtpl/Jinja
+
+The petition templates only use scalar placeholders (no loops or
+conditionals), so each render is a text substitution on a copy of the
+pre-parsed XML parts.  Placeholders split across runs are handled: the
+value goes into the run holding the opening braces and the rest of the
+placeholder is cut from the following runs, leaving their formatting alone.
+"""
+import copy
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+from lxml import etree
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+_TEMPLATED_PART = re.compile(r"word/(document|header\d*|footer\d*)\.xml$")
+_TOKEN_PARAGRAPHS = etree.XPath(
+    './/w:p[contains(string(.), "{{")]', namespaces={"w": _W[1:-1]}
+)
+
+
+@lru_cache(maxsize=4)
+def _load_parts(template_path, mtime_ns, size):
+    """Zip entries of a template, with placeholder parts pre-parsed"""
+    parts = []
+    with zipfile.ZipFile(template_path) as z:
+        for info in z.infolist():
+            data = z.read(info)
+            if _TEMPLATED_PART.match(info.filename) and b"{{" in data:
+                data = etree.fromstring(data)
+            parts.append((info, data))
+    return tuple(parts)
+
+
+def _fill_paragraph(p, context):
+    """Substitute the placeholders in one paragraph's own runs"""
+    texts = [t for t in p.iter(_W + "t") if next(t.iterancestors(_W + "p")) is p]
+    full = "".join(t.text or "" for t in texts)
+    matches = list(_PLACEHOLDER.finditer(full))
+    if not matches:
+        return
+
+    # Character offset at which each <w:t> starts in the joined text
+    starts = []
+    pos = 0
+    for t in texts:
+        starts.append(pos)
+        pos += len(t.text or "")
+
+    def locate(offset):
+        i = len(starts) - 1
+        while starts[i] > offset:
+            i -= 1
+        return i
+
+    # Right to left, so earlier offsets stay valid
+    for m in reversed(matches):
+        value = str(context.get(m.group(1), ""))
+        first, last = locate(m.start()), locate(m.end() - 1)
+        tail = (texts[last].text or "")[m.end() - starts[last]:]
+        head = (texts[first].text or "")[:m.start() - starts[first]]
+        if first == last:
+            texts[first].text = head + value + tail
+        else:
+            texts[first].text = head + value
+            for t in texts[first + 1:last]:
+                t.text = ""
+            texts[last].text = tail
+        for t in texts[first:last + 1]:
+            t.set(_XML_SPACE, "preserve")
+
+
+def _render_bytes(template_path, context):
+    """The filled .docx for one context, as bytes"""
+    st = os.stat(template_path)
+    parts = _load_parts(template_path, st.st_mtime_ns, st.st_size)
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as out:
+        for info, data in parts:
+            if not isinstance(data, bytes):
+                root = copy.deepcopy(data)
+                for p in _TOKEN_PARAGRAPHS(root):
+                    _fill_paragraph(p, context)
+                data = etree.tostring(root, xml_declaration=True,
+                                      encoding="UTF-8", standalone=True)
+            out.writestr(info, data)
+    return buf.getvalue()
+
+
+def _write_file(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def render_template(template_path, output_path, context):
+    """Write *template_path* to *output_path* with placeholders filled from *context*
+
+    Unknown placeholders render as empty strings, as they do in Jinja.
+    The zip is assembled in memory and written with a single call, which
+    matters when the output folder is on a network drive.
+    """
+    _write_file(output_path, _render_bytes(template_path, context))
+    return output_path
+
+
+def render_many(template_path, jobs):
+    """Render ``(output_path, context)`` jobs from one template
+
+    Each file is written on a background thread while the next one renders.
+    Returns the output paths.
+    """
+    paths = []
+    futures = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        for output_path, context in jobs:
+            data = _render_bytes(template_path, context)
+            futures.append(pool.submit(_write_file, output_path, data))
+            paths.append(output_path)
+    for future in futures:
+        future.result()
+    return paths
@@ -1,11 +1,8 @@
-from docxtpl import DocxTemplate
+from petition_render import render_template
 import os
 
 def generate_petition(template_path, output_path, petition_data):
-    # 1. Load the template
-    doc = DocxTemplate(template_path)
-
-    # 2. Process conditional fields based on boolean flags
+    # 1. Process conditional fields based on boolean flags
     is_petitioner_company = petition_data.get("is_petitioner_company", False)
     is_multiple_dwelling = petition_data.get("is_multiple_dwelling", False)
     is_under_rent_stabilization = petition_data.get("is_under_rent_stabilization", False)
@@ -47,7 +44,7 @@ def generate_petition(template_path, output_path, petition_data):
 
     rent_stabilization_not = " " if is_under_rent_stabilization else "not"
 
-    # 3. Define the context (data to fill)
+    # 2. Define the context (data to fill)
     context = {
         "PETITIONER_NAME": petition_data["petitioner_name"],
         "PETITIONER_ADDRESS_LINE1": petition_data["petitioner_address_line1"],
@@ -69,11 +66,8 @@ def generate_petition(template_path, output_path, petition_data):
         "AGENT_ADDRESS": agent_address
     }
 
-    # 4. Render the template
-    doc.render(context)
-
-    # 5. Save the result
-    doc.save(output_path)
+    # 3. Render the template and save the result
+    render_template(template_path, output_path, context)
     print(f"Success! Saved to {output_path}")
 
 if __name__ == "__main__":